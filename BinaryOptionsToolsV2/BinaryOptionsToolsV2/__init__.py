@@ -1,11 +1,31 @@
-
-from .BinaryOptionsToolsV2 import *  # noqa: F403
+from . import BinaryOptionsToolsV2 as _rust
+from .BinaryOptionsToolsV2 import (  # noqa: F401
+    LogBuilder,
+    Logger,
+    PyConfig,
+    RawPocketOption,
+    RawStreamIterator,
+    RawValidator,
+    StreamIterator,
+    StreamLogsDictIterator,
+    StreamLogsIterator,
+    StreamLogsLayer,
+    start_tracing,
+)
 
 # optional: include the documentation from the Rust module
-from .BinaryOptionsToolsV2 import __doc__  # noqa: F401
+__doc__ = _rust.__doc__
 
 from .pocketoption import __all__ as __pocket_all__
+from . import pocketoption
 from . import tracing
 from . import validator
 
-__all__ = __pocket_all__ + ['tracing', 'validator']
+__all__ = (*__pocket_all__, 'tracing', 'validator')
+
+
+def __getattr__(name):
+    # The clients are resolved lazily through the `pocketoption` package
+    if name in __pocket_all__:
+        return getattr(pocketoption, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,14 @@
+"""
+JSON helpers shared by the package, `orjson` is used when it is installed
+and the standard library `json` module otherwise.
+"""
+
+try:
+    from orjson import dumps as _orjson_dumps, loads
+
+    def dumps(obj) -> str:
+        return _orjson_dumps(obj).decode()
+except ImportError:
+    from json import dumps, loads
+
+__all__ = ("dumps", "loads")
@@ -0,0 +1,49 @@
+"""
+Compact candle types returned by the `*_typed` candle functions.
+"""
+
+from typing import NamedTuple
+
+
+class Candle(NamedTuple):
+    """
+    Single OHLC candle.
+
+    A tuple subclass, so it takes a fraction of the memory of the equivalent
+    dictionary and can be unpacked as `time, open, high, low, close`.
+    """
+    # Unix timestamp in seconds
+    time: int
+    open: float
+    high: float
+    low: float
+    close: float
+
+
+# Field layout of the buffer returned by `RawPocketOption.get_candles_buffer`,
+# every record is a little endian i64 timestamp followed by four f64 prices
+CANDLE_FIELDS = (("time", "<i8"), ("open", "<f8"), ("high", "<f8"), ("low", "<f8"), ("close", "<f8"))
+
+_CANDLE_DTYPE = None
+
+
+def candle_dtype():
+    """Returns the numpy structured dtype matching `CANDLE_FIELDS` (requires `numpy`)"""
+    global _CANDLE_DTYPE
+    if _CANDLE_DTYPE is None:
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("numpy is required for the candle arrays, install it with `pip install BinaryOptionsToolsV2[numpy]`") from e
+        _CANDLE_DTYPE = np.dtype(list(CANDLE_FIELDS))
+    return _CANDLE_DTYPE
+
+
+def candles_from_buffer(buffer: bytes):
+    """
+    Wraps a packed candle buffer in a numpy structured array without copying it.
+    The returned array is read only as it shares the memory of `buffer`.
+    """
+    dtype = candle_dtype()
+    import numpy as np
+    return np.frombuffer(buffer, dtype=dtype)
@@ -0,0 +1,72 @@
+"""
+Deterministic fault injection for the raw order functions of `PocketOptionAsync`.
+
+Meant for tests and benchmarks of the retry, timeout and circuit breaker code
+without depending on real network failures, never enable it in production.
+"""
+
+from random import Random
+
+import asyncio
+
+
+class ChaosRule:
+    """
+    Injects faults before the raw order calls reach the client.
+
+    Every call draws a single number from a generator seeded with `seed`, so the
+    same sequence of calls always fails the same way:
+        - with probability `timeout_rate` it raises `asyncio.TimeoutError`
+        - with probability `error_rate` it raises `ValueError`, like every error of the Rust client
+        - with probability `slow_rate` it waits `slow_secs` seconds before sending the order
+
+    Args:
+        seed: Seed of the random generator
+        timeout_rate: Probability of an injected timeout
+        error_rate: Probability of an injected client error
+        slow_rate: Probability of an injected delay
+        slow_secs: Length of the injected delays in seconds
+        operations: Names of the functions affected (like "create_raw_order"), None for all of them
+
+    Example:
+        ```python
+        chaos = ChaosRule(seed=42, timeout_rate=0.1, error_rate=0.1)
+        client = PocketOptionAsync(ssid, chaos=chaos)
+        ```
+    """
+    __slots__ = ("seed", "timeout_rate", "error_rate", "slow_rate", "slow_secs", "operations", "_random")
+
+    def __init__(
+        self,
+        seed: int = 0,
+        timeout_rate: float = 0.0,
+        error_rate: float = 0.0,
+        slow_rate: float = 0.0,
+        slow_secs: float = 1.0,
+        operations: set[str] | None = None,
+    ):
+        self.seed = seed
+        self.timeout_rate = timeout_rate
+        self.error_rate = error_rate
+        self.slow_rate = slow_rate
+        self.slow_secs = slow_secs
+        self.operations = frozenset(operations) if operations is not None else None
+        self._random = Random(seed)
+
+    def reset(self) -> None:
+        """Restarts the fault sequence from the beginning"""
+        self._random.seed(self.seed)
+
+    async def apply(self, operation: str) -> None:
+        """Raises or waits according to the next draw, called before the `operation` client call"""
+        if self.operations is not None and operation not in self.operations:
+            return
+        draw = self._random.random()
+        if draw < self.timeout_rate:
+            raise asyncio.TimeoutError(f"Chaos: injected timeout in '{operation}'")
+        draw -= self.timeout_rate
+        if draw < self.error_rate:
+            raise ValueError(f"Chaos: injected error in '{operation}'")
+        draw -= self.error_rate
+        if draw < self.slow_rate:
+            await asyncio.sleep(self.slow_secs)
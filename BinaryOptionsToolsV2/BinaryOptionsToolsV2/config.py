@@ -1,30 +1,114 @@
 from BinaryOptionsToolsV2 import PyConfig
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from typing import Dict, Any, List, Tuple
+from collections import OrderedDict
 
-import json
+import threading
+import warnings
+
+from BinaryOptionsToolsV2._json import dumps as _dumps, loads as _loads
+
+# Built PyConfig instances keyed by their field values, so identical
+# configurations share a single Rust object. Bounded to the most recent entries.
+_PYCONFIG_CACHE: "OrderedDict[tuple, PyConfig]" = OrderedDict()
+_PYCONFIG_CACHE_SIZE = 32
+_PYCONFIG_CACHE_LOCK = threading.Lock()
+
+# Values of a `Config()` built with every default, these share a single PyConfig
+# that never gets evicted from the cache above.
+_DEFAULTS = (100, 100, 5, 30, (), 16384)
+
+# Deprecated, the Rust client waits a fixed 500ms after connecting whatever its value
+_DEPRECATED_INIT_TIMEOUT = "connection_initialization_timeout_secs"
+_DEFAULT_INIT_TIMEOUT = 30
+
+def _warn_init_timeout():
+    warnings.warn(
+        f"'{_DEPRECATED_INIT_TIMEOUT}' has no effect and will be removed in a future version",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+_DEFAULT_PYCONFIG = None
+
+def _default_pyconfig() -> PyConfig:
+    global _DEFAULT_PYCONFIG
+    if _DEFAULT_PYCONFIG is None:
+        with _PYCONFIG_CACHE_LOCK:
+            if _DEFAULT_PYCONFIG is None:
+                _DEFAULT_PYCONFIG = PyConfig()
+    return _DEFAULT_PYCONFIG
 
-@dataclass
 class Config:
     """
     Python wrapper around PyConfig that provides additional functionality
     for configuration management.
     """
-    max_allowed_loops: int = 100
-    sleep_interval: int = 100
-    reconnect_time: int = 5
-    connection_initialization_timeout_secs: int = 30
-    timeout_secs: int = 30
-    urls: List[str] = None
-    
-    # Extra duration, used by functions like `check_win`
-    extra_duration: int = 5
-
-    def __post_init__(self):
-        self.urls = self.urls or []
+    __slots__ = (
+        "max_allowed_loops",
+        "sleep_interval",
+        "reconnect_time",
+        # Deprecated, has no effect
+        "connection_initialization_timeout_secs",
+        "timeout_secs",
+        "urls",
+        # Size in bytes of the websocket read buffer
+        "read_buffer_size",
+        # Extra duration, used by functions like `check_win`
+        "extra_duration",
+        # Seconds a fetched payout table is reused by `payout`
+        "payout_ttl",
+        # Consecutive failures of a raw order endpoint before its circuit breaker opens
+        "breaker_threshold",
+        # Seconds an open circuit breaker rejects calls before letting a trial call through
+        "breaker_recovery_secs",
+        "_pyconfig",
+        "_locked",
+    )
+    _FIELDS = frozenset(__slots__[:11])
+    # Keys emitted by `to_dict`, the slot names are already interned identifiers
+    _TO_DICT_KEYS = __slots__[:11]
+
+    def __init__(
+        self,
+        max_allowed_loops: int = 100,
+        sleep_interval: int = 100,
+        reconnect_time: int = 5,
+        connection_initialization_timeout_secs: int = 30,
+        timeout_secs: int = 30,
+        urls: List[str] | Tuple[str, ...] = (),
+        extra_duration: int = 5,
+        # Keyword only, positional calls keep the order of the original fields
+        *,
+        read_buffer_size: int = 16384,
+        payout_ttl: float = 1.0,
+        breaker_threshold: int = 5,
+        breaker_recovery_secs: float = 30.0,
+    ):
+        self.max_allowed_loops = max_allowed_loops
+        self.sleep_interval = sleep_interval
+        self.reconnect_time = reconnect_time
+        if connection_initialization_timeout_secs != _DEFAULT_INIT_TIMEOUT:
+            _warn_init_timeout()
+        self.connection_initialization_timeout_secs = connection_initialization_timeout_secs
+        self.timeout_secs = timeout_secs
+        # Stored as a tuple so it can be shared with PyConfig without defensive copies
+        self.urls = tuple(urls or ())
+        self.read_buffer_size = read_buffer_size
+        self.extra_duration = extra_duration
+        self.payout_ttl = payout_ttl
+        self.breaker_threshold = breaker_threshold
+        self.breaker_recovery_secs = breaker_recovery_secs
         self._pyconfig = None
         self._locked = False
 
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__[:11])
+        return f"Config({fields})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Config):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__[:11])
+
     @property
     def pyconfig(self) -> PyConfig:
         """
@@ -32,25 +116,45 @@ class Config:
         Once this is accessed, the configuration becomes locked.
         """
         if self._pyconfig is None:
-            self._pyconfig = PyConfig()
-            self._update_pyconfig()
+            key = self._pyconfig_key()
+            if key == _DEFAULTS:
+                self._pyconfig = _default_pyconfig()
+                self._locked = True
+                return self._pyconfig
+            with _PYCONFIG_CACHE_LOCK:
+                cached = _PYCONFIG_CACHE.get(key)
+                if cached is None:
+                    cached = self._build_pyconfig()
+                    _PYCONFIG_CACHE[key] = cached
+                    if len(_PYCONFIG_CACHE) > _PYCONFIG_CACHE_SIZE:
+                        _PYCONFIG_CACHE.popitem(last=False)
+                else:
+                    _PYCONFIG_CACHE.move_to_end(key)
+            self._pyconfig = cached
         self._locked = True
         return self._pyconfig
 
-    def _update_pyconfig(self):
-        """Updates the internal PyConfig with current values"""
-        if self._locked:
-            raise RuntimeError("Configuration is locked and cannot be modified after being used")
-        
-        if self._pyconfig is None:
-            self._pyconfig = PyConfig()
-            
-        self._pyconfig.max_allowed_loops = self.max_allowed_loops
-        self._pyconfig.sleep_interval = self.sleep_interval
-        self._pyconfig.reconnect_time = self.reconnect_time
-        self._pyconfig.connection_initialization_timeout_secs = self.connection_initialization_timeout_secs
-        self._pyconfig.timeout_secs = self.timeout_secs
-        self._pyconfig.urls = self.urls.copy()
+    def _pyconfig_key(self) -> tuple:
+        """Returns the values that end up in the PyConfig, used as the cache key"""
+        return (
+            self.max_allowed_loops,
+            self.sleep_interval,
+            self.reconnect_time,
+            self.timeout_secs,
+            tuple(self.urls),
+            self.read_buffer_size,
+        )
+
+    def _build_pyconfig(self) -> PyConfig:
+        """Creates an immutable PyConfig from the current values"""
+        return PyConfig(
+            max_allowed_loops=self.max_allowed_loops,
+            sleep_interval=self.sleep_interval,
+            reconnect_time=self.reconnect_time,
+            timeout_secs=self.timeout_secs,
+            urls=self.urls,
+            read_buffer_size=self.read_buffer_size,
+        )
 
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'Config':
@@ -63,9 +167,10 @@ class Config:
         Returns:
             Config instance
         """
+        fields = cls._FIELDS
         return cls(**{
-            k: v for k, v in config_dict.items() 
-            if k in Config.__dataclass_fields__
+            k: v for k, v in config_dict.items()
+            if k in fields
         })
 
     @classmethod
@@ -79,7 +184,7 @@ class Config:
         Returns:
             Config instance
         """
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_loads(json_str))
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -88,14 +193,19 @@ class Config:
         Returns:
             Dictionary containing all configuration values
         """
-        return {
-            'max_allowed_loops': self.max_allowed_loops,
-            'sleep_interval': self.sleep_interval,
-            'reconnect_time': self.reconnect_time,
-            'connection_initialization_timeout_secs': self.connection_initialization_timeout_secs,
-            'timeout_secs': self.timeout_secs,
-            'urls': self.urls
-        }
+        return dict(zip(self._TO_DICT_KEYS, (
+            self.max_allowed_loops,
+            self.sleep_interval,
+            self.reconnect_time,
+            self.connection_initialization_timeout_secs,
+            self.timeout_secs,
+            list(self.urls),
+            self.read_buffer_size,
+            self.extra_duration,
+            self.payout_ttl,
+            self.breaker_threshold,
+            self.breaker_recovery_secs,
+        )))
 
     def to_json(self) -> str:
         """
@@ -104,7 +214,7 @@ class Config:
         Returns:
             JSON string containing all configuration values
         """
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
 
     def update(self, config_dict: Dict[str, Any]) -> None:
         """
@@ -116,7 +226,12 @@ class Config:
         if self._locked:
             raise RuntimeError("Configuration is locked and cannot be modified after being used")
         
+        fields = self._FIELDS
         for key, value in config_dict.items():
-            if hasattr(self, key):
+            if key in fields:
+                if key == "urls":
+                    value = tuple(value or ())
+                elif key == _DEPRECATED_INIT_TIMEOUT and value != _DEFAULT_INIT_TIMEOUT:
+                    _warn_init_timeout()
                 setattr(self, key, value)
 
@@ -3,11 +3,27 @@ Module for Pocket Option related functionality.
 
 Contains asynchronous and synchronous clients,
 as well as specific classes for Pocket Option trading.
+
+The client submodules are only imported on first access, so programs that
+only use one of the clients never load the other one.
 """
 
-__all__ = ['asyncronous', 'syncronous', 'PocketOptionAsync', 'PocketOption']
+__all__ = ('asyncronous', 'syncronous', 'PocketOptionAsync', 'PocketOption')
+
+from importlib import import_module
+
+
+def __getattr__(name):
+    if name in ("asyncronous", "PocketOptionAsync"):
+        asyncronous = import_module(".asyncronous", __name__)
+        globals()["PocketOptionAsync"] = asyncronous.PocketOptionAsync
+        return globals()[name]
+    if name in ("syncronous", "PocketOption"):
+        syncronous = import_module(".syncronous", __name__)
+        globals()["PocketOption"] = syncronous.PocketOption
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from . import asyncronous, syncronous
-from .asyncronous import PocketOptionAsync
-from .syncronous import PocketOption
 
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -1,29 +1,297 @@
 from BinaryOptionsToolsV2.validator import Validator
 from BinaryOptionsToolsV2.config import Config
+from BinaryOptionsToolsV2.candles import Candle, candles_from_buffer
+from BinaryOptionsToolsV2.retry import RetryPolicy
+from BinaryOptionsToolsV2.chaos import ChaosRule
 from BinaryOptionsToolsV2 import RawPocketOption, Logger
 from datetime import timedelta
+from collections import OrderedDict
+from functools import lru_cache
+from importlib.util import find_spec
+from struct import Struct
+from time import monotonic, time
 
 
 import asyncio
-import json
-import time 
 import sys 
 
+from BinaryOptionsToolsV2._json import loads as _loads
+
+# Layout of the records yielded by `RawPocketOption.subscribe_symbol_close`
+_unpack_close = Struct("<qd").unpack
+
 
 class AsyncSubscription:
+    __slots__ = ("subscription", "_next", "_loads")
+
     def __init__(self, subscription):
         """Asyncronous Iterator over json objects"""
         self.subscription = subscription
+        # Bound once, `__anext__` runs for every message of the stream
+        self._next = subscription.__anext__
+        self._loads = _loads
         
     def __aiter__(self):
         return self
         
     async def __anext__(self):
-        return json.loads(await anext(self.subscription))
+        return self._loads(await self._next())
+
+
+class AsyncSubscriptionBatched:
+    __slots__ = ("subscription", "max_n", "max_wait_ms", "_next_batch", "_loads")
+
+    def __init__(self, subscription, max_n: int = 64, max_wait_ms: int = 5):
+        """Asyncronous Iterator over lists of json objects, every item holds all the updates received within `max_wait_ms` (at most `max_n`)"""
+        self.subscription = subscription
+        self.max_n = max_n
+        self.max_wait_ms = max_wait_ms
+        self._next_batch = subscription.next_batch
+        self._loads = _loads
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        loads = self._loads
+        return [loads(raw) for raw in await self._next_batch(self.max_n, self.max_wait_ms)]
     
+class AsyncRawBatchedIterator:
+    __slots__ = ("iterator", "max_n", "max_wait_ms", "_next_batch")
+
+    def __init__(self, iterator, max_n: int = 64, max_wait_ms: int = 5):
+        """Asyncronous Iterator over lists of raw messages, every item holds all the messages received within `max_wait_ms` (at most `max_n`)"""
+        self.iterator = iterator
+        self.max_n = max_n
+        self.max_wait_ms = max_wait_ms
+        self._next_batch = iterator.next_batch
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self._next_batch(self.max_n, self.max_wait_ms)
+
+
+class RawSubscription:
+    __slots__ = ("iterator", "_client", "_next")
+
+    def __init__(self, client, iterator):
+        """
+        Asyncronous Iterator over the raw messages accepted by a validator, that can also send
+        messages through the same connection. Nothing is registered again after it's created.
+        """
+        self.iterator = iterator
+        self._client = client
+        self._next = iterator.__anext__
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self._next()
+
+    async def send(self, payload: str | bytes) -> None:
+        """Sends a raw message, the responses accepted by the validator are yielded by this iterator"""
+        await self._client.send_raw_message(payload)
+
+    def send_nowait(self, payload: str | bytes) -> None:
+        """Same as `send` but only queues the message, raises `ValueError` if the sending queue is full"""
+        self._client.send_raw_message_nowait(payload)
+
+    def batches(self, max_n: int = 64, max_wait_ms: int = 5) -> 'AsyncRawBatchedIterator':
+        """Iterates over the same messages in lists, see `create_raw_iterator_batched`"""
+        return AsyncRawBatchedIterator(self.iterator, max_n, max_wait_ms)
+
+
+class PrefetchingSubscription:
+    __slots__ = ("subscription", "_queue", "_task")
+
+    def __init__(self, subscription, maxsize: int = 128):
+        """
+        Asyncronous Iterator over json objects, a background task keeps reading and parsing up to
+        `maxsize` messages ahead while the current one is being processed.
+        Must be created from a running event loop, call `close` to stop the background task early.
+        """
+        self.subscription = subscription
+        self._queue = asyncio.Queue(maxsize)
+        self._task = asyncio.get_running_loop().create_task(self._prefetch())
+
+    async def _prefetch(self):
+        put = self._queue.put
+        next_message = self.subscription.__anext__
+        try:
+            while True:
+                await put(_loads(await next_message()))
+        except Exception as e:
+            # Includes StopAsyncIteration, raised again by `__anext__` once the queue is drained
+            await put(e)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await self._queue.get()
+        if isinstance(item, BaseException):
+            # Keep it queued so every following call raises it too
+            self._queue.put_nowait(item)
+            raise item
+        return item
+
+    def close(self):
+        """Stops reading messages in the background and ends the iteration"""
+        self._task.cancel()
+        # A cancelled `_prefetch` never queues its end marker, it is queued here instead of the prefetched messages
+        queue = self._queue
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(StopAsyncIteration())
+
+
+class AsyncCloseSubscription:
+    __slots__ = ("subscription", "_next")
+
+    def __init__(self, subscription):
+        """Asyncronous Iterator over `(timestamp, close)` tuples"""
+        self.subscription = subscription
+        self._next = subscription.__anext__
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return _unpack_close(await self._next())
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of sending a raw order while the circuit breaker of its endpoint is open"""
+
+
+class _CircuitBreaker:
+    __slots__ = ("failure_threshold", "recovery_window", "_failures", "_opened_at")
+
+    def __init__(self, failure_threshold: int, recovery_window: float):
+        """
+        Opens after `failure_threshold` consecutive failures and rejects every call for
+        `recovery_window` seconds, then lets a trial call through (half open): a success
+        closes it again (the client drops the breaker) while a failure keeps it open for another window.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_window = recovery_window
+        self._failures = 0
+        # `monotonic` time when the breaker was opened, None while it's closed
+        self._opened_at = None
+
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        now = monotonic()
+        if now - self._opened_at >= self.recovery_window:
+            # Half open, the following calls are rejected until this one finishes or the window elapses again
+            self._opened_at = now
+            return True
+        return False
+
+    def record_failure(self):
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._opened_at = monotonic()
+
+
+# Bound of the circuit breakers kept by a client, messages starting with ids or timestamps
+# would otherwise add a breaker per message
+_MAX_BREAKERS = 1024
+
+
+def _breaker_key(message: str | bytes | bytearray) -> bytes:
+    # First 32 bytes of the encoded message, hashable for every input type and shared
+    # by the same message sent as `str` or as bytes
+    if isinstance(message, str):
+        return message[:32].encode()[:32]
+    return bytes(message[:32])
+
+
+class _RawOrderBatcher:
+    __slots__ = ("client", "max_batch", "_pending", "_tasks")
+
+    def __init__(self, client, max_batch: int = 64):
+        """
+        Coalesces the raw orders submitted during the same event loop iteration into a
+        single `create_raw_orders_batch` call. The queue is flushed on the next iteration,
+        or right away once `max_batch` orders are waiting.
+        """
+        self.client = client
+        self.max_batch = max_batch
+        self._pending = []
+        # Keeps a reference to the running flushes so they aren't garbage collected
+        self._tasks = set()
+
+    def submit(self, message: str, validator) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((message, validator, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif len(self._pending) == 1:
+            loop.call_soon(self._flush)
+        return future
+
+    def _flush(self):
+        pending, self._pending = self._pending, []
+        if not pending:
+            # Already flushed because the batch got full
+            return
+        task = asyncio.get_running_loop().create_task(self._send(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, pending: list):
+        try:
+            results = await self.client.create_raw_orders_batch([(message, validator) for message, validator, _ in pending])
+        except Exception as e:
+            for *_, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (*_, future), (ok, response) in zip(pending, results):
+            # Skip the callers that stopped waiting
+            if future.done():
+                continue
+            if ok:
+                future.set_result(response)
+            else:
+                future.set_exception(ValueError(response))
+
+
+@lru_cache(maxsize=32)
+def _config_fields_from_json(config: str) -> tuple:
+    # Only the parsing is shared by the clients built from the same JSON string, the
+    # values are kept immutable (`urls` as a tuple) so the cached entry can't be changed
+    fields = Config._FIELDS
+    return tuple(
+        (key, tuple(value or ()) if key == "urls" else value)
+        for key, value in _loads(config).items()
+        if key in fields
+    )
+
+
+def _config_from_json(config: str) -> Config:
+    # Every client gets its own Config, the Python only fields like `payout_ttl` are read
+    # live from it. Identical values still share a single PyConfig through its cache
+    return Config(**dict(_config_fields_from_json(config)))
+
+
+# Turns every accepted `config` argument type into a `Config`
+_CONFIG_BUILDERS = {
+    Config: lambda config: config,
+    dict: Config.from_dict,
+    str: _config_from_json,
+}
+
+
 # This file contains all the async code for the PocketOption Module
 class PocketOptionAsync:
-    def __init__(self, ssid: str, url: str | None = None, config: Config | dict | str = None, **_):
+    def __init__(self, ssid: str, url: str | None = None, config: Config | dict | str = None, max_inflight: int = 256, chaos: ChaosRule | None = None, **_):
         """
         Initializes a new PocketOptionAsync instance.
 
@@ -41,9 +309,12 @@ class PocketOptionAsync:
                     - max_allowed_loops (int): Maximum number of event loop iterations
                     - sleep_interval (int): Sleep time between operations in milliseconds
                     - reconnect_time (int): Time to wait before reconnection attempts in seconds
-                    - connection_initialization_timeout_secs (int): Connection initialization timeout
                     - timeout_secs (int): General operation timeout
                     - urls (List[str]): List of fallback WebSocket URLs
+            max_inflight (int, optional): Maximum number of raw orders (`create_raw_order*` calls) waiting for a response at
+                the same time, further calls wait for a slot. Defaults to 256.
+            chaos (ChaosRule | None, optional): Injects deterministic faults in the raw order functions, only meant for tests
+                and benchmarks. Defaults to None.
             **_: Additional keyword arguments (ignored)
 
         Examples:
@@ -91,29 +362,55 @@ class PocketOptionAsync:
             - Custom URLs provided in the `url` parameter take precedence over URLs in the configuration
             - Invalid configuration values will raise appropriate exceptions
         """
-        if config is not None:
-            if isinstance(config, dict):
-                self.config = Config.from_dict(config)
-            elif isinstance(config, str):
-                self.config = Config.from_json(config)
-            elif isinstance(config, Config):
-                self.config = config
-            else:
-                raise ValueError("Config must be either a Config object, dictionary, or JSON string")
-
-            if url is not None:
-                self.client = RawPocketOption.new_with_url(ssid, url, self.config.pyconfig)
-            else:
-                self.client = RawPocketOption(ssid, config, self.config.pyconfig)
-        else: 
+        if config is None:
             self.config = Config()
-            if url is not None:
-                self.client = RawPocketOption.new_with_url(ssid, url)
-            else:
-                self.client = RawPocketOption(ssid)
+            pyconfig = None
+        else:
+            build = _CONFIG_BUILDERS.get(type(config))
+            if build is None:
+                # Subclasses of the accepted types
+                build = next((b for t, b in _CONFIG_BUILDERS.items() if isinstance(config, t)), None)
+                if build is None:
+                    raise ValueError("Config must be either a Config object, dictionary, or JSON string")
+            self.config = build(config)
+            pyconfig = self.config.pyconfig
+        self.client = RawPocketOption(ssid, pyconfig, url)
         self.logger = Logger()
+        _hint_fast_loop(self.logger)
+        # (fetch time, payout table) of the last `payout` call
+        self._payout_cache = (0.0, None)
+        # The account type is fixed by the ssid, so `is_demo` only asks the client once
+        self._is_demo_cache = None
+        # (`monotonic` time of the last sync, server time minus local time) used by `get_server_time`
+        self._server_time_offset = (None, 0.0)
+        # Created by the first `create_raw_order_batched` call
+        self._order_batcher = None
+        # Bounds the raw orders in flight so a burst of calls can't flood the websocket sender
+        self._raw_sem = asyncio.Semaphore(max_inflight)
+        # Circuit breakers of `create_raw_order_with_timout` and `create_raw_order_with_timeout_and_retry`,
+        # keyed by the start of the message so a failing endpoint doesn't block the other ones.
+        # Only the breakers with failures are kept, at most `_MAX_BREAKERS` of them (least recently used dropped first)
+        self._breakers = OrderedDict()
+        self._chaos = chaos
     
     
+    @staticmethod
+    def install_fast_loop() -> bool:
+        """
+        Makes asyncio use `uvloop` (or `winloop` on Windows) for the event loops created from now on,
+        call it before `asyncio.run` or before creating a sync `PocketOption` client.
+
+        Both are optional, install them with `pip install BinaryOptionsToolsV2[fast-loop]`.
+
+        Returns:
+            bool: True if a faster event loop was installed, False if none is available
+        """
+        for module in _FAST_LOOP_MODULES:
+            if find_spec(module) is not None:
+                __import__(module).install()
+                return True
+        return False
+
     async def buy(self, asset: str, amount: float, time: int, check_win: bool = False) -> tuple[str, dict]:
         """
         Places a buy (call) order for the specified asset.
@@ -139,12 +436,11 @@ class PocketOptionAsync:
             ValueError: If invalid parameters are provided
             TimeoutError: If trade confirmation times out
         """
-        (trade_id, trade) = await self.client.buy(asset, amount, time)
         if check_win:
-            return trade_id, await self.check_win(trade_id) 
-        else:
-            trade = json.loads(trade)
-            return trade_id, trade 
+            # Places the trade and waits for its result in a single call
+            (trade_id, trade) = await self.client.buy_and_await_result(asset, amount, time, self.config.extra_duration)
+            return trade_id, _with_result(_loads(trade))
+        return await self._buy_fast(asset, amount, time)
        
     async def sell(self, asset: str, amount: float, time: int, check_win: bool = False) -> tuple[str, dict]:
         """
@@ -171,12 +467,21 @@ class PocketOptionAsync:
             ValueError: If invalid parameters are provided
             TimeoutError: If trade confirmation times out
         """
-        (trade_id, trade) = await self.client.sell(asset, amount, time)
         if check_win:
-            return trade_id, await self.check_win(trade_id)   
-        else:
-            trade = json.loads(trade)
-            return trade_id, trade 
+            # Places the trade and waits for its result in a single call
+            (trade_id, trade) = await self.client.sell_and_await_result(asset, amount, time, self.config.extra_duration)
+            return trade_id, _with_result(_loads(trade))
+        return await self._sell_fast(asset, amount, time)
+
+    async def _buy_fast(self, asset: str, amount: float, time: int) -> tuple[str, dict]:
+        # `buy` without `check_win`, the common case of the sync client
+        (trade_id, trade) = await self.client.buy_bytes(asset, amount, time)
+        return trade_id, _loads(trade)
+
+    async def _sell_fast(self, asset: str, amount: float, time: int) -> tuple[str, dict]:
+        # `sell` without `check_win`, the common case of the sync client
+        (trade_id, trade) = await self.client.sell_bytes(asset, amount, time)
+        return trade_id, _loads(trade)
  
     async def check_win(self, id: str) -> dict:
         """
@@ -196,29 +501,9 @@ class PocketOptionAsync:
             ValueError: If trade_id is invalid
             TimeoutError: If result check times out
         """
-        end_time = await self.client.get_deal_end_time(id)
-        
-        if end_time is not None:
-            duration = end_time - int(time.time())
-            if duration <= 0:
-                duration = 5 # If duration is less than 0 then the trade is closed and the function should take less than 5 seconds to run
-        else:
-            duration = 5
-        duration += self.config.extra_duration
-        
-        self.logger.debug(f"Timeout set to: {duration} (6 extra seconds)")
-        async def check(id):
-            trade = await self.client.check_win(id)
-            trade = json.loads(trade)
-            win = trade["profit"]
-            if win > 0:
-                trade["result"] = "win"
-            elif win == 0:
-                trade["result"] = "draw"
-            else:
-                trade["result"] = "loss"
-            return trade
-        return await _timeout(check(id), duration)
+        # The wait (deal expiration + `extra_duration`) is handled on the Rust side,
+        # this resolves as soon as the closing message for the deal arrives
+        return _with_result(_loads(await self.client.await_deal_result(id, self.config.extra_duration)))
         
         
     async def get_candles(self, asset: str, period: int, offset: int) -> list[dict]:  
@@ -242,8 +527,25 @@ class PocketOptionAsync:
             Available timeframes: 1, 5, 15, 30, 60, 300 seconds
             Maximum period depends on the timeframe
         """
-        candles = await self.client.get_candles(asset, period, offset)
-        return json.loads(candles)
+        candles = await self.client.get_candles_bytes(asset, period, offset)
+        return _loads(candles)
+    
+    async def get_candles_typed(self, asset: str, period: int, offset: int) -> list[Candle]:
+        """
+        Same as `get_candles` but returns `Candle` named tuples (`time, open, high, low, close`, with
+        `time` as a unix timestamp in seconds) instead of dictionaries, the data is also sent by the
+        Rust side as compact rows so it is smaller to parse.
+        """
+        return list(map(Candle._make, _loads(await self.client.get_candles_rows(asset, period, offset))))
+    
+    async def get_candles_np(self, asset: str, period: int, offset: int):
+        """
+        Same as `get_candles` but returns a numpy structured array with the fields `time` (unix timestamp
+        in seconds), `open`, `high`, `low` and `close`, built directly over the buffer sent by Rust so
+        there is no JSON parsing and no per candle Python object.
+        Requires `numpy`, the returned array is read only.
+        """
+        return candles_from_buffer(await self.client.get_candles_buffer(asset, period, offset))
     
     async def get_candles_advanced(self, asset: str, period: int, offset: int, time: int) -> list[dict]:  
         """
@@ -268,7 +570,7 @@ class PocketOptionAsync:
             Maximum period depends on the timeframe
         """
         candles = await self.client.get_candles_advanced(asset, period, offset, time)
-        return json.loads(candles)
+        return _loads(candles)
 
 
     
@@ -282,21 +584,21 @@ class PocketOptionAsync:
         Note:
             Updates in real-time as trades are completed
         """
-        return json.loads(await self.client.balance())["balance"]
+        return await self.client.balance_float()
     
     async def opened_deals(self) -> list[dict]:
         "Returns a list of all the opened deals as dictionaries"
-        return json.loads(await self.client.opened_deals())
+        return _loads(await self.client.opened_deals())
     
     async def closed_deals(self) -> list[dict]:
         "Returns a list of all the closed deals as dictionaries"
-        return json.loads(await self.client.closed_deals())
+        return _loads(await self.client.closed_deals())
     
     async def clear_closed_deals(self) -> None:
         "Removes all the closed deals from memory, this function doesn't return anything"
         await self.client.clear_closed_deals()
 
-    async def payout(self, asset: None | str | list[str] = None) -> dict | list[int] | int:
+    async def payout(self, asset: None | str | list[str] | set[str] = None) -> dict | list[int] | int:
         """
         Retrieves current payout percentages for all assets.
 
@@ -307,27 +609,43 @@ class PocketOptionAsync:
                     "GBPUSD": 82,      # 82% payout
                     ...
                 }
-            list: If asset is a list, returns a list of payouts for each asset in the same order
+            list: If asset is a list or tuple, returns a list of payouts for each asset in the same order
+            dict: If asset is a set, returns a dict with the payout of each asset
             int: If asset is a string, returns the payout for that specific asset
             none: If asset didn't match and valid asset none will be returned
+
+        Note:
+            The payout table is reused for `Config.payout_ttl` seconds before being fetched again.
         """        
-        payout = json.loads(await self.client.payout())
-        if isinstance(asset, str):
-            return payout.get(asset)
-        elif isinstance(asset, list):
-            return [payout.get(ast) for ast in asset]
-        return payout
+        payout = self._cached_payout()
+        if payout is None:
+            payout = _loads(await self.client.payout())
+            self._payout_cache = (monotonic(), payout)
+        return _select_payout(payout, asset)
+
+    def _cached_payout(self) -> dict | None:
+        # The payout table if it was fetched less than `Config.payout_ttl` seconds ago, None otherwise
+        fetched, payout = self._payout_cache
+        if payout is not None and monotonic() - fetched < self.config.payout_ttl:
+            return payout
+        return None
     
     async def history(self, asset: str, period: int) -> list[dict]:
         "Returns a list of dictionaries containing the latest data available for the specified asset starting from 'period', the data is in the same format as the returned data of the 'get_candles' function."
-        return json.loads(await self.client.history(asset, period))
+        return _loads(await self.client.history(asset, period))
     
     async def _subscribe_symbol_inner(self, asset: str) :
-        return await self.client.subscribe_symbol(asset)
+        return await self.client.subscribe_symbol_bytes(asset)
+    
+    async def _subscribe_symbol_close_inner(self, asset: str):
+        return await self.client.subscribe_symbol_close(asset)
     
     async def _subscribe_symbol_chuncked_inner(self, asset: str, chunck_size: int):
         return await self.client.subscribe_symbol_chuncked(asset, chunck_size)
     
+    async def _subscribe_symbol_chuncked_buffer_inner(self, asset: str, chunck_size: int):
+        return await self.client.subscribe_symbol_chuncked_buffer(asset, chunck_size)
+    
     async def _subscribe_symbol_timed_inner(self, asset: str, time: timedelta):
         return await self.client.subscribe_symbol_timed(asset, time)
     
@@ -349,6 +667,55 @@ class PocketOptionAsync:
             ```
         """
         return AsyncSubscription(await self._subscribe_symbol_inner(asset))
+
+    async def subscribe_symbol_prefetch(self, asset: str, maxsize: int = 128) -> PrefetchingSubscription:
+        """
+        Creates a real-time data subscription for an asset that reads and parses updates in the background.
+
+        Up to `maxsize` updates are received and decoded ahead of time while the current one is processed,
+        overlapping the parsing with the network. Useful for throughput bound consumers like tick recorders.
+
+        Args:
+            asset (str): Trading asset to subscribe to
+            maxsize (int): Maximum number of updates buffered ahead
+
+        Returns:
+            PrefetchingSubscription: Async iterator yielding real-time price updates
+        """
+        return PrefetchingSubscription(await self._subscribe_symbol_inner(asset), maxsize)
+
+    async def subscribe_symbol_close(self, asset: str) -> AsyncCloseSubscription:
+        """
+        Creates a real-time subscription for an asset that only yields the close price of every update.
+
+        Every item is a `(timestamp, close)` tuple, with the unix timestamp in seconds. The updates are
+        sent by Rust as fixed size binary records so there is no JSON parsing involved, use this when
+        the rest of the candle is not needed.
+
+        Args:
+            asset (str): Trading asset to subscribe to
+
+        Returns:
+            AsyncCloseSubscription: Async iterator yielding `(timestamp, close)` tuples
+        """
+        return AsyncCloseSubscription(await self._subscribe_symbol_close_inner(asset))
+
+    async def subscribe_symbol_batched(self, asset: str, max_n: int = 64, max_wait_ms: int = 5) -> AsyncSubscriptionBatched:
+        """
+        Creates a real-time data subscription for an asset that yields updates in batches.
+
+        Every iteration waits for the next update and then collects the ones that arrive within `max_wait_ms`,
+        which reduces the per-update overhead on high frequency streams.
+
+        Args:
+            asset (str): Trading asset to subscribe to
+            max_n (int): Maximum number of updates in a single batch
+            max_wait_ms (int): Time in milliseconds to wait for more updates after the first one
+
+        Returns:
+            AsyncSubscriptionBatched: Async iterator yielding lists of real-time price updates
+        """
+        return AsyncSubscriptionBatched(await self._subscribe_symbol_inner(asset), max_n, max_wait_ms)
     
     async def subscribe_symbol_chuncked(self, asset: str, chunck_size: int) -> AsyncSubscription:
         """Returns an async iterator over the associated asset, it will return real time candles formed with the specified amount of raw candles and will return new candles while the 'PocketOptionAsync' class is loaded if the class is droped then the iterator will fail"""
@@ -375,22 +742,36 @@ class PocketOptionAsync:
         """
         return AsyncSubscription(await self._subscribe_symbol_timed_inner(asset, time))
     
-    async def send_raw_message(self, message: str) -> None:
+    async def send_raw_message(self, message: str | bytes) -> None:
         """
         Sends a raw WebSocket message without waiting for a response.
         
         Args:
-            message: Raw WebSocket message to send (e.g., '42["ping"]')
+            message: Raw WebSocket message to send (e.g., '42["ping"]'), `bytes` and `bytearray` are sent as is and must hold UTF-8 text
         """
         await self.client.send_raw_message(message)
+
+    def send_raw_message_nowait(self, message: str | bytes) -> None:
+        """
+        Queues a raw WebSocket message and returns immediately, without awaiting.
+        
+        Meant for fire-and-forget traffic like pings or heartbeats.
+        
+        Args:
+            message: Raw WebSocket message to send (e.g., '42["ping"]'), `bytes` and `bytearray` are sent as is and must hold UTF-8 text
+            
+        Raises:
+            ValueError: If the sending queue is full
+        """
+        self.client.send_raw_message_nowait(message)
         
-    async def create_raw_order(self, message: str, validator: Validator) -> str:
+    async def create_raw_order(self, message: str | bytes, validator: Validator) -> str:
         """
         Sends a raw WebSocket message and waits for a validated response.
         
         Args:
-            message: Raw WebSocket message to send
-            validator: Validator instance to validate the response
+            message: Raw WebSocket message to send, `str`, `bytes` or `bytearray`
+            validator: Validator instance, or a spec tuple like `("starts_with", "451-")`, to validate the response
             
         Returns:
             str: The first message that matches the validator's conditions
@@ -402,51 +783,172 @@ class PocketOptionAsync:
                 '42["signals/subscribe"]',
                 validator
             )
+            # Already encoded payloads can be sent without decoding them
+            response = await client.create_raw_order(b'42["signals/subscribe"]', validator)
             ```
         """
-        return await self.client.create_raw_order(message, validator.raw_validator)
+        async with self._raw_sem:
+            if self._chaos is not None:
+                await self._chaos.apply("create_raw_order")
+            return await self.client.create_raw_order(message, _validator_arg(validator))
         
-    async def create_raw_order_with_timout(self, message: str, validator: Validator, timeout: timedelta) -> str:
+    def create_raw_order_sync(self, message: str | bytes, validator: Validator, timeout: timedelta | float | None = None) -> str:
+        """
+        Blocking version of `create_raw_order` (or `create_raw_order_with_timout` when `timeout` is set)
+        that skips the event loop entirely, meant for scripts that send one message and wait for it.
+
+        Only use it when no event loop is running in the current thread, as it blocks until the response arrives.
+
+        Args:
+            message: Raw WebSocket message to send, `str`, `bytes` or `bytearray`
+            validator: Validator instance, or a spec tuple like `("starts_with", "451-")`, to validate the response
+            timeout: Optional maximum time to wait for a valid response, a `timedelta` or seconds
+
+        Returns:
+            str: The first message that matches the validator's conditions
+        """
+        return self.client.create_raw_order_sync(message, _validator_arg(validator), timeout)
+
+    async def create_raw_order_batched(self, message: str | bytes, validator: Validator) -> str:
+        """
+        Same as `create_raw_order`, but the orders sent concurrently from the same event loop
+        iteration are submitted to the client together in a single call, which is cheaper when
+        many orders are sent at once (for example through `asyncio.gather`).
+
+        Args:
+            message: Raw WebSocket message to send, `str`, `bytes` or `bytearray`
+            validator: Validator instance, or a spec tuple like `("starts_with", "451-")`, to validate the response
+
+        Returns:
+            str: The first message that matches the validator's conditions
+
+        Example:
+            ```python
+            responses = await asyncio.gather(*(
+                client.create_raw_order_batched(message, validator) for message in messages
+            ))
+            ```
+        """
+        if self._order_batcher is None:
+            self._order_batcher = _RawOrderBatcher(self.client)
+        async with self._raw_sem:
+            return await self._order_batcher.submit(message, _validator_arg(validator))
+
+    async def create_raw_order_with_timout(self, message: str | bytes, validator: Validator, timeout: timedelta | float) -> str:
         """
         Similar to create_raw_order but with a timeout.
         
         Args:
-            message: Raw WebSocket message to send
-            validator: Validator instance to validate the response
-            timeout: Maximum time to wait for a valid response
+            message: Raw WebSocket message to send, `str`, `bytes` or `bytearray`
+            validator: Validator instance, or a spec tuple like `("starts_with", "451-")`, to validate the response
+            timeout: Maximum time to wait for a valid response, a `timedelta` or seconds
             
         Returns:
             str: The first message that matches the validator's conditions
             
         Raises:
             TimeoutError: If no valid response is received within the timeout period
+            CircuitOpenError: If the recent orders starting like `message` kept failing (see `Config.breaker_threshold`)
         """
 
-        return await self.client.create_raw_order_with_timeout(message, validator.raw_validator, timeout)
+        return await self._call_with_breaker(
+            message,
+            lambda: self.client.create_raw_order_with_timeout(message, _validator_arg(validator), timeout),
+            "create_raw_order_with_timout",
+        )
     
-    async def create_raw_order_with_timeout_and_retry(self, message: str, validator: Validator, timeout: timedelta) -> str:
+    async def create_raw_order_with_timeout_and_retry(self, message: str | bytes, validator: Validator, timeout: timedelta | float, retry_policy: RetryPolicy | None = None) -> str:
         """
         Similar to create_raw_order_with_timout but with automatic retry on failure.
         
         Args:
-            message: Raw WebSocket message to send
-            validator: Validator instance to validate the response
-            timeout: Maximum time to wait for each attempt
+            message: Raw WebSocket message to send, `str`, `bytes` or `bytearray`
+            validator: Validator instance, or a spec tuple like `("starts_with", "451-")`, to validate the response
+            timeout: Maximum time to wait for a valid response across every attempt, a `timedelta` or seconds
+            retry_policy: Optional `RetryPolicy`, retries with jittered exponential backoff instead of the client's built in retries
             
         Returns:
             str: The first message that matches the validator's conditions
+
+        Raises:
+            TimeoutError: If no valid response is received within `timeout`
+            CircuitOpenError: If the recent orders starting like `message` kept failing (see `Config.breaker_threshold`)
         """
+        if retry_policy is None:
+            return await self._call_with_breaker(
+                message,
+                lambda: self.client.create_raw_order_with_timeout_and_retry(message, _validator_arg(validator), timeout),
+                "create_raw_order_with_timeout_and_retry",
+            )
+        return await self._call_with_breaker(
+            message, lambda: self._create_raw_order_with_policy(message, _validator_arg(validator), timeout, retry_policy)
+        )
+
+    async def _call_with_breaker(self, message: str, send, operation: str | None = None):
+        # `send` only gets called once the breaker allows it, as the Rust calls start running as soon as they are made.
+        # `operation` names the call for the chaos rule and the in flight slot is held for the whole `send`,
+        # None when `send` applies the chaos rule and takes a slot per attempt itself (never while sleeping)
+        key = _breaker_key(message)
+        breakers = self._breakers
+        breaker = breakers.get(key)
+        if breaker is not None:
+            breakers.move_to_end(key)
+            if not breaker.allow():
+                raise CircuitOpenError(f"Too many failed raw orders starting with {key!r}, retry later")
+        try:
+            if operation is None:
+                response = await send()
+            else:
+                async with self._raw_sem:
+                    if self._chaos is not None:
+                        await self._chaos.apply(operation)
+                    response = await send()
+        # `asyncio.TimeoutError` is only an alias of `TimeoutError` since python 3.11
+        except (TimeoutError, asyncio.TimeoutError, ValueError):
+            # Looked up again, a concurrent call may have created or dropped it meanwhile
+            breaker = breakers.get(key)
+            if breaker is None:
+                breaker = breakers[key] = _CircuitBreaker(self.config.breaker_threshold, self.config.breaker_recovery_secs)
+                if len(breakers) > _MAX_BREAKERS:
+                    breakers.popitem(last=False)
+            breaker.record_failure()
+            raise
+        # A success closes the breaker and clears its failures, so there's nothing left to keep
+        breakers.pop(key, None)
+        return response
 
-        return await self.client.create_raw_order_with_timeout_and_retry(message, validator.raw_validator, timeout)
+    async def _create_raw_order_with_policy(self, message: str | bytes, validator, timeout: timedelta | float, policy: RetryPolicy) -> str:
+        # Every attempt shares a single deadline, so retrying never exceeds `timeout`
+        deadline = monotonic() + (timeout.total_seconds() if isinstance(timeout, timedelta) else timeout)
+        attempt = 0
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"No valid response received within {timeout}")
+            try:
+                # Waiting for an in flight slot counts towards the deadline, the slot is released before the backoff
+                async with _deadline(remaining), self._raw_sem:
+                    if self._chaos is not None:
+                        await self._chaos.apply("create_raw_order_with_timeout_and_retry")
+                    return await self.client.create_raw_order(message, validator)
+            except policy.retryable_errors:
+                attempt += 1
+                if attempt >= policy.max_attempts:
+                    raise
+                delay = policy.delay(attempt - 1)
+                # Not worth retrying if the attempt would barely have any time left
+                if monotonic() + delay + _MIN_ATTEMPT_SECS >= deadline:
+                    raise
+                await asyncio.sleep(delay)
  
-    async def create_raw_iterator(self, message: str, validator: Validator, timeout: timedelta | None = None):
+    async def create_raw_iterator(self, message: str | bytes, validator: Validator, timeout: timedelta | float | None = None):
         """
         Creates an async iterator that yields validated WebSocket messages.
         
         Args:
-            message: Initial WebSocket message to send
-            validator: Validator instance to filter incoming messages
-            timeout: Optional timeout for the entire stream
+            message: Initial WebSocket message to send, `str`, `bytes` or `bytearray`
+            validator: Validator instance, or a spec tuple like `("starts_with", "451-")`, to filter incoming messages
+            timeout: Optional timeout for the entire stream, a `timedelta` or seconds
             
         Returns:
             AsyncIterator yielding validated messages
@@ -462,11 +964,72 @@ class PocketOptionAsync:
                 print(f"Received: {message}")
             ```
         """
-        return await self.client.create_raw_iterator(message, validator, timeout)
+        return await self.client.create_raw_iterator(message, _validator_arg(validator), timeout)
     
-    async def get_server_time(self) -> int:
-        """Returns the current server time as a UNIX timestamp"""
-        return await self.client.get_server_time()
+    async def create_raw_iterator_batched(self, message: str | bytes, validator: Validator, max_n: int = 64, timeout: timedelta | float | None = None, max_wait_ms: int = 5) -> AsyncRawBatchedIterator:
+        """
+        Same as `create_raw_iterator`, but every iteration yields a list with all the validated messages
+        received within `max_wait_ms` of the first one, which reduces the per-message overhead on busy streams.
+
+        Args:
+            message: Initial WebSocket message to send, `str`, `bytes` or `bytearray`
+            validator: Validator instance, or a spec tuple like `("starts_with", "451-")`, to filter incoming messages
+            max_n: Maximum number of messages in a single batch
+            timeout: Optional timeout for the entire stream, a `timedelta` or seconds
+            max_wait_ms: Time in milliseconds to wait for more messages after the first one
+
+        Returns:
+            AsyncRawBatchedIterator: Async iterator yielding lists of validated messages
+
+        Example:
+            ```python
+            validator = Validator.starts_with('{"signals":')
+            async for batch in await client.create_raw_iterator_batched('42["signals/subscribe"]', validator):
+                for message in batch:
+                    print(f"Received: {message}")
+            ```
+        """
+        return AsyncRawBatchedIterator(await self.create_raw_iterator(message, validator, timeout), max_n, max_wait_ms)
+
+    async def subscribe_raw(self, message: str | bytes, validator: Validator, timeout: timedelta | float | None = None) -> RawSubscription:
+        """
+        Sends `message` once and returns a subscription over every following message accepted by
+        `validator`, use it instead of calling `create_raw_order` in a loop with the same subscribe message.
+
+        Args:
+            message: Initial WebSocket message to send, `str`, `bytes` or `bytearray`
+            validator: Validator instance, or a spec tuple like `("starts_with", "451-")`, to filter incoming messages
+            timeout: Optional timeout for the entire stream, a `timedelta` or seconds
+
+        Returns:
+            RawSubscription: Async iterator over the validated messages, with `send` to keep talking to the server
+
+        Example:
+            ```python
+            sub = await client.subscribe_raw('42["signals/subscribe"]', Validator.starts_with('451-["signals/load"'))
+            async for message in sub:
+                print(f"Received: {message}")
+                await sub.send('42["signals/next"]')
+            ```
+        """
+        return RawSubscription(self.client, await self.create_raw_iterator(message, validator, timeout))
+
+    async def get_server_time(self, force_refresh: bool = False) -> int:
+        """
+        Returns the current server time as a UNIX timestamp.
+
+        The offset between the server and the local clock is fetched at most every
+        `_SERVER_TIME_SYNC_SECS` seconds, the calls in between only read the local clock.
+
+        Args:
+            force_refresh (bool): Fetches the offset from the client right away
+        """
+        synced_at, offset = self._server_time_offset
+        now = monotonic()
+        if force_refresh or synced_at is None or now - synced_at >= _SERVER_TIME_SYNC_SECS:
+            offset = await self.client.get_server_time() - time()
+            self._server_time_offset = (now, offset)
+        return int(time() + offset)
     
     async def is_demo(self) -> bool:
         """
@@ -496,11 +1059,108 @@ class PocketOptionAsync:
                 return await client.buy(asset, amount, duration)
             ```
         """
-        return await self.client.is_demo()
+        if self._is_demo_cache is None:
+            self._is_demo_cache = await self.client.is_demo()
+        return self._is_demo_cache
+
+    def invalidate_session(self) -> None:
+        """
+        Clears the values cached for the current session (the account type used by `is_demo`
+        and the payout table), call it after logging in again with a different account.
+        """
+        self._is_demo_cache = None
+        self._payout_cache = (0.0, None)
+
+# Shortest time in seconds worth spending on a retried raw order
+_MIN_ATTEMPT_SECS = 0.1
+
+# Seconds `get_server_time` keeps using the same server clock offset
+_SERVER_TIME_SYNC_SECS = 30.0
+
+_FAST_LOOP_MODULES = ("winloop",) if sys.platform == "win32" else ("uvloop",)
+_fast_loop_hinted = False
 
-async def _timeout(future, timeout: int):
-    if sys.version_info[:3] >= (3,11): 
-        async with asyncio.timeout(timeout):
-            return await future
+
+def _hint_fast_loop(logger):
+    # Suggests `install_fast_loop` once per process when a faster event loop is installed but unused
+    global _fast_loop_hinted
+    if _fast_loop_hinted:
+        return
+    try:
+        loop_type = type(asyncio.get_running_loop())
+    except RuntimeError:
+        # Event loop policies are deprecated since python 3.14, without a running loop there is nothing to check then
+        if sys.version_info >= (3, 14):
+            return
+        loop_type = type(asyncio.get_event_loop_policy())
+    _fast_loop_hinted = True
+    if not loop_type.__module__.startswith("asyncio"):
+        return
+    for module in _FAST_LOOP_MODULES:
+        if find_spec(module) is not None:
+            logger.warn(f"{module} is installed but asyncio uses its default event loop, call `PocketOptionAsync.install_fast_loop()` before starting the loop to use it")
+            return
+
+
+def _validator_arg(validator):
+    # The raw order functions accept a Validator or the underlying RawValidator (as shown in the
+    # sync client examples), both are unwrapped by the Rust side, or a spec tuple like `("starts_with", "451-")`
+    if type(validator) is tuple:
+        return Validator.from_spec(*validator)
+    return validator
+
+
+def _select_payout(payout: dict, asset):
+    # Picks the requested assets out of the payout table for `payout`
+    if isinstance(asset, str):
+        return payout.get(asset)
+    elif isinstance(asset, (list, tuple)):
+        return [payout.get(ast) for ast in asset]
+    elif isinstance(asset, (set, frozenset)):
+        return {ast: payout.get(ast) for ast in asset}
+    # Copied so callers can't modify the cached table
+    return dict(payout)
+
+
+def _with_result(trade: dict) -> dict:
+    # Adds the "result" key ("win", "draw" or "loss") to a closed deal
+    win = trade["profit"]
+    if win > 0:
+        trade["result"] = "win"
+    elif win == 0:
+        trade["result"] = "draw"
     else:
-        return await asyncio.wait_for(future, timeout)
+        trade["result"] = "loss"
+    return trade
+
+
+# Context manager that cancels the awaits inside it once `delay` seconds have passed and raises
+# `TimeoutError` instead. Unlike `asyncio.wait_for` it runs them in the current task, without
+# wrapping them in a new one. The implementation is picked once at import
+if sys.version_info >= (3, 11):
+    _deadline = asyncio.timeout
+else:
+    class _deadline:
+        __slots__ = ("_delay", "_task", "_handle", "_expired")
+
+        def __init__(self, delay: float | None):
+            self._delay = delay
+            self._handle = None
+            self._expired = False
+
+        async def __aenter__(self):
+            if self._delay is not None:
+                self._task = asyncio.current_task()
+                self._handle = asyncio.get_running_loop().call_later(self._delay, self._expire)
+            return self
+
+        def _expire(self):
+            self._expired = True
+            self._task.cancel()
+
+        async def __aexit__(self, exc_type, exc, tb):
+            if self._handle is not None:
+                self._handle.cancel()
+            if self._expired and exc_type is asyncio.CancelledError:
+                raise asyncio.TimeoutError from exc
+            return False
@@ -1,25 +1,283 @@
-from .asyncronous import PocketOptionAsync
+from .asyncronous import PocketOptionAsync, _unpack_close, _select_payout, _FAST_LOOP_MODULES
 from BinaryOptionsToolsV2.config import Config
+from BinaryOptionsToolsV2.candles import Candle, candle_dtype, candles_from_buffer
+from BinaryOptionsToolsV2.retry import RetryPolicy
 from BinaryOptionsToolsV2.validator import Validator
 from datetime import timedelta
 
 import asyncio
-import json
+import atexit
+import threading
+import warnings
+from collections import deque
+from importlib import import_module
+from queue import Empty, Full, Queue
+from typing import Iterator
+
+from BinaryOptionsToolsV2._json import loads as _loads
+
+# The private loop of the sync client uses uvloop (winloop on Windows) when it's installed
+_new_event_loop = asyncio.new_event_loop
+for _module in _FAST_LOOP_MODULES:
+    try:
+        _new_event_loop = import_module(_module).new_event_loop
+        break
+    except ImportError:
+        pass
+
+
+class _LoopService:
+    """
+    Event loop shared by every sync client, running on its own thread. It's started by the
+    first client and, once every client is closed, the pending tasks are cancelled and it's stopped.
+    """
+    _lock = threading.Lock()
+    _loop = None
+    _thread = None
+    _clients = 0
+
+    @classmethod
+    def acquire(cls) -> tuple[asyncio.AbstractEventLoop, threading.Thread]:
+        with cls._lock:
+            if cls._loop is None:
+                cls._loop = _new_event_loop()
+                cls._thread = threading.Thread(target=cls._loop.run_forever, name="PocketOptionLoop", daemon=True)
+                cls._thread.start()
+            cls._clients += 1
+            return cls._loop, cls._thread
+
+    @classmethod
+    def release(cls) -> None:
+        with cls._lock:
+            cls._clients -= 1
+            if cls._clients > 0:
+                return
+            loop, thread = cls._loop, cls._thread
+            cls._loop = cls._thread = None
+        if thread.is_alive():
+            try:
+                asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), loop).result(timeout=1)
+            except Exception:
+                pass
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=1)
+        # At interpreter shutdown the daemon thread can be gone while the loop still looks running
+        if not thread.is_alive() and not loop.is_running():
+            loop.close()
+
+
+async def _cancel_pending_tasks():
+    # Cancels every other task of the running loop and waits for them to finish
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _in_running_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _warn_if_in_loop(subscription):
+    # Called when a sync subscription starts being iterated, every message blocks the thread
+    # and so the whole event loop when it's done from a coroutine
+    if _in_running_loop():
+        warnings.warn(
+            f"{type(subscription).__name__} blocks the running event loop while waiting for messages, use the subscriptions of PocketOptionAsync inside async code",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
+def _start_task(loop, coro, callback):
+    # Called on the loop thread by `PocketOption._run`
+    loop.create_task(coro).add_done_callback(callback)
+
+
+def _start_check_wins(loop, check_win, ids, put):
+    # Called on the loop thread by `PocketOption.check_win_stream`, every finished
+    # task is handed to `put` together with its trade id
+    for id in ids:
+        loop.create_task(check_win(id)).add_done_callback(lambda task, id=id: put((id, task)))
+
+
+def _iter_results(results: Queue, count: int):
+    for _ in range(count):
+        id, task = results.get()
+        yield id, task.result()
+
+
+async def _gather(coros):
+    # `asyncio.gather` has to be called from the loop thread
+    return await asyncio.gather(*coros)
 
 
 class SyncSubscription:
-    def __init__(self, subscription):
+    __slots__ = ("subscription", "batch_n", "max_wait_ms", "_next_batch", "_buffer")
+
+    def __init__(self, subscription, batch_n: int = 64, max_wait_ms: int = 0):
+        """
+        Iterator over json objects. Messages are read from Rust up to `batch_n` at a time, waiting
+        at most `max_wait_ms` after the first one (by default only the ones already received are
+        taken), and handed out one by one.
+        """
         self.subscription = subscription
+        self.batch_n = batch_n
+        self.max_wait_ms = max_wait_ms
+        # Bound once, `__next__` runs for every message of the stream
+        self._next_batch = subscription.next_batch_sync
+        self._buffer = deque()
         
     def __iter__(self):
+        _warn_if_in_loop(self)
         return self
         
     def __next__(self):
-        return json.loads(next(self.subscription))        
+        buffer = self._buffer
+        if not buffer:
+            buffer.extend(self._next_batch(self.batch_n, self.max_wait_ms))
+        return _loads(buffer.popleft())
     
 
+class SyncRawSubscription(SyncSubscription):
+    """Iterator over the raw messages (`str`) of `create_raw_iterator`, they are returned as received without being parsed"""
+    __slots__ = ()
+
+    def __next__(self):
+        buffer = self._buffer
+        if not buffer:
+            buffer.extend(self._next_batch(self.batch_n, self.max_wait_ms))
+        return buffer.popleft()
+
+
+class SyncPrefetchingSubscription:
+    __slots__ = ("subscription", "_queue", "_thread", "_closed")
+
+    def __init__(self, subscription, maxsize: int = 128):
+        """
+        Iterator over json objects, a background thread keeps reading and parsing up to `maxsize`
+        messages ahead while the current one is being processed. The thread stops once the stream
+        ends or after `close` (called when leaving a `with` block), which is required for streams
+        that never end like `subscribe_symbol`.
+        """
+        self.subscription = subscription
+        self._queue = Queue(maxsize)
+        self._closed = False
+        # Daemon thread, it can stay blocked waiting for a message without holding up the interpreter exit
+        self._thread = threading.Thread(target=self._prefetch, name="PocketOptionPrefetch", daemon=True)
+        self._thread.start()
+
+    def _prefetch(self):
+        put = self._queue.put
+        next_batch = self.subscription.next_batch_sync
+        try:
+            while not self._closed:
+                for message in next_batch(64, 0):
+                    if self._closed:
+                        return
+                    put(_loads(message))
+        except Exception as e:
+            # Includes StopIteration, raised again by `__next__` once the queue is drained
+            put(e)
+
+    def __iter__(self):
+        _warn_if_in_loop(self)
+        return self
+
+    def __next__(self):
+        if self._closed:
+            raise StopIteration
+        item = self._queue.get()
+        if isinstance(item, BaseException):
+            # Keep it queued so every following call raises it too
+            self._queue.put_nowait(item)
+            raise item
+        return item
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops the background thread and ends the iteration. The thread exits after its current read,
+        as soon as the next message arrives, without keeping the parsed messages.
+        """
+        self._closed = True
+        queue = self._queue
+        # Frees the thread blocked on a full queue, it checks the flag before every other put
+        while True:
+            try:
+                queue.get_nowait()
+            except Empty:
+                break
+        # Wakes up a consumer blocked in `__next__` from another thread
+        try:
+            queue.put_nowait(StopIteration())
+        except Full:
+            pass
+
+
+class SyncNumpySubscription:
+    __slots__ = ("subscription", "batch_n", "max_wait_ms", "_next_batch")
+
+    def __init__(self, subscription, batch_n: int = 64, max_wait_ms: int = 0):
+        """
+        Iterator over numpy structured arrays with the fields `time`, `open`, `high`, `low` and `close`.
+        Every array holds the candles received since the previous one (at least one, up to `batch_n`,
+        waiting at most `max_wait_ms` after the first). Requires `numpy`, the arrays are read only.
+        """
+        self.subscription = subscription
+        self.batch_n = batch_n
+        self.max_wait_ms = max_wait_ms
+        self._next_batch = subscription.next_batch_sync
+
+    def __iter__(self):
+        _warn_if_in_loop(self)
+        return self
+
+    def __next__(self):
+        return candles_from_buffer(b"".join(self._next_batch(self.batch_n, self.max_wait_ms)))
+
+
+class SyncCloseSubscription:
+    __slots__ = ("subscription", "_next")
+
+    def __init__(self, subscription):
+        self.subscription = subscription
+        self._next = subscription.__next__
+
+    def __iter__(self):
+        _warn_if_in_loop(self)
+        return self
+
+    def __next__(self):
+        return _unpack_close(self._next())
+
+
 class PocketOption:
-    def __init__(self, ssid: str, config: Config | dict | str = None, **_):
+    __slots__ = (
+        "loop",
+        "_thread",
+        "_closed",
+        "_client",
+        "_call_soon_threadsafe",
+        "_tls",
+        "_buy",
+        "_sell",
+        "_buy_fast",
+        "_sell_fast",
+        "_check_win",
+        "_create_raw_order_sync",
+    )
+
+    def __init__(self, ssid: str, config: Config | dict | str = None, max_inflight: int = 256, **_):
         """
         Initializes a new PocketOption instance.
 
@@ -38,9 +296,9 @@ class PocketOption:
                     - max_allowed_loops (int): Maximum number of event loop iterations
                     - sleep_interval (int): Sleep time between operations in milliseconds
                     - reconnect_time (int): Time to wait before reconnection attempts in seconds
-                    - connection_initialization_timeout_secs (int): Connection initialization timeout
                     - timeout_secs (int): General operation timeout
                     - urls (List[str]): List of fallback WebSocket URLs
+            max_inflight (int, optional): Maximum number of raw orders waiting for a response at the same time. Defaults to 256.
             **_: Additional keyword arguments (ignored)
 
         Examples:
@@ -98,18 +356,83 @@ class PocketOption:
             ```
 
         Note:
-            - Creates a new event loop for handling async operations synchronously
+            - Every sync client shares one event loop (uvloop or winloop when installed), running in a background thread, for handling async operations synchronously
             - The configuration becomes locked once initialized and cannot be modified afterwards
             - Custom URLs provided in the `url` parameter take precedence over URLs in the configuration
             - Invalid configuration values will raise appropriate exceptions
-            - The event loop is automatically closed when the instance is deleted
+            - The event loop is closed once every client is closed by `close()`, when leaving a `with` block or at interpreter exit
             - All async operations are wrapped to provide a synchronous interface
+            - Inside a running event loop (Jupyter, async web frameworks...) use `PocketOptionAsync` instead, a `RuntimeWarning` is emitted otherwise
         """        
-        self.loop = asyncio.new_event_loop()
-        self._client = PocketOptionAsync(ssid, config)
+        if _in_running_loop():
+            warnings.warn(
+                "PocketOption blocks the running event loop on every call, use PocketOptionAsync inside async code",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        # The loop runs on its own thread, shared with the other sync clients, so background
+        # tasks keep making progress between calls
+        self.loop, self._thread = _LoopService.acquire()
+        self._closed = False
+        try:
+            self._client = PocketOptionAsync(ssid, config=config, max_inflight=max_inflight)
+        except BaseException:
+            # Nothing else holds the loop for this client, `close` won't ever be called
+            self._closed = True
+            _LoopService.release()
+            raise
+        # Bound once to skip the attribute lookups on the trading hot paths
+        self._call_soon_threadsafe = self.loop.call_soon_threadsafe
+        # Per calling thread `Event` reused by `_run`
+        self._tls = threading.local()
+        self._buy = self._client.buy
+        self._sell = self._client.sell
+        self._buy_fast = self._client._buy_fast
+        self._sell_fast = self._client._sell_fast
+        self._check_win = self._client.check_win
+        self._create_raw_order_sync = self._client.create_raw_order_sync
+        # Safety net for clients that are never closed, it also keeps them alive until then
+        atexit.register(self.close)
     
-    def __del__(self):
-        self.loop.close()
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Releases the shared event loop, the last client to close it cancels its pending tasks, stops
+        the loop and its thread and closes it. Called when leaving a `with` block and at interpreter exit,
+        calling it again does nothing.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        _LoopService.release()
+
+    def _run(self, coro):
+        # Runs `coro` on the loop thread and blocks until it's done. Unlike `run_coroutine_threadsafe`
+        # it doesn't allocate a `concurrent.futures.Future` (and its condition) per call, every
+        # calling thread reuses the same `Event`
+        tls = self._tls
+        try:
+            done = tls.done
+        except AttributeError:
+            done = tls.done = threading.Event()
+        result = []
+
+        def callback(task):
+            result.append(task)
+            done.set()
+
+        self._call_soon_threadsafe(_start_task, self.loop, coro, callback)
+        # The event can also be set late by a call that was interrupted (like by KeyboardInterrupt)
+        while not result:
+            done.wait()
+            done.clear()
+        return result[0].result()
 
     def buy(self, asset: str, amount: float, time: int, check_win: bool = False) -> tuple[str, dict]:
         """
@@ -117,7 +440,9 @@ class PocketOption:
         If check_win is True then the function will return a tuple containing the trade id and a dictionary containing the trade data and the result of the trade ("win", "draw", "loss)
         If check_win is False then the function will return a tuple with the id of the trade and the trade as a dict
         """
-        return self.loop.run_until_complete(self._client.buy(asset, amount, time, check_win))
+        if not check_win:
+            return self._run(self._buy_fast(asset, amount, time))
+        return self._run(self._buy(asset, amount, time, True))
        
     def sell(self, asset: str, amount: float, time: int, check_win: bool = False) -> tuple[str, dict]:
         """
@@ -125,11 +450,41 @@ class PocketOption:
         If check_win is True then the function will return a tuple containing the trade id and a dictionary containing the trade data and the result of the trade ("win", "draw", "loss)
         If check_win is False then the function will return a tuple with the id of the trade and the trade as a dict
         """
-        return self.loop.run_until_complete(self._client.sell(asset, amount, time, check_win))
+        if not check_win:
+            return self._run(self._sell_fast(asset, amount, time))
+        return self._run(self._sell(asset, amount, time, True))
     
     def check_win(self, id: str) -> dict:
         """Returns a dictionary containing the trade data and the result of the trade ("win", "draw", "loss)"""
-        return self.loop.run_until_complete(self._client.check_win(id))
+        return self._run(self._check_win(id))
+
+    def buy_many(self, orders: list[tuple]) -> list[tuple[str, dict]]:
+        """
+        Places several buy trades at once, each order is a tuple of the `buy` arguments: (asset, amount, time) or (asset, amount, time, check_win).
+        The trades are sent concurrently, so the call takes about as long as the slowest one instead of the sum of all of them,
+        prefer it over calling `buy` in a loop. Returns the results in the same order as `orders`, the first error is raised.
+        """
+        buy = self._buy
+        return self._run(_gather([buy(*order) for order in orders]))
+
+    def sell_many(self, orders: list[tuple]) -> list[tuple[str, dict]]:
+        """Like `buy_many` for sell trades, each order is a tuple of the `sell` arguments"""
+        sell = self._sell
+        return self._run(_gather([sell(*order) for order in orders]))
+
+    def check_win_many(self, ids: list[str]) -> list[dict]:
+        """Waits for the results of several trades concurrently, returns them in the same order as `ids`"""
+        check_win = self._check_win
+        return self._run(_gather([check_win(id) for id in ids]))
+
+    def check_win_stream(self, ids: list[str]) -> Iterator[tuple[str, dict]]:
+        """
+        Waits for the results of several trades concurrently and yields `(id, result)` tuples as soon as each one is known,
+        so unlike `check_win_many` the first results don't wait for the slowest trade. The error of a failed trade is raised when reached.
+        """
+        results = Queue()
+        self._call_soon_threadsafe(_start_check_wins, self.loop, self._check_win, ids, results.put_nowait)
+        return _iter_results(results, len(ids))
 
     def get_candles(self, asset: str, period: int, offset: int) -> list[dict]:
         """
@@ -141,7 +496,21 @@ class PocketOption:
             * high: highest price
             * low: lowest price
         """
-        return self.loop.run_until_complete(self._client.get_candles(asset, period, offset))
+        return self._run(self._client.get_candles(asset, period, offset))
+    
+    def get_candles_typed(self, asset: str, period: int, offset: int) -> list[Candle]:
+        """
+        Same as `get_candles` but returns `Candle` named tuples (`time, open, high, low, close`, with
+        `time` as a unix timestamp in seconds) instead of dictionaries.
+        """
+        return self._run(self._client.get_candles_typed(asset, period, offset))
+    
+    def get_candles_np(self, asset: str, period: int, offset: int):
+        """
+        Same as `get_candles` but returns a read only numpy structured array with the fields `time`
+        (unix timestamp in seconds), `open`, `high`, `low` and `close`. Requires `numpy`.
+        """
+        return self._run(self._client.get_candles_np(asset, period, offset))
     
     def get_candles_advanced(self, asset: str, period: int, offset: int, time: int) -> list[dict]:  
         """
@@ -166,54 +535,79 @@ class PocketOption:
             Maximum period depends on the timeframe
         """
         
-        return self.loop.run_until_complete(self._client.get_candles_advanced(asset, period, offset, time))
+        return self._run(self._client.get_candles_advanced(asset, period, offset, time))
 
 
     def balance(self) -> float:
         "Returns the balance of the account"
-        return self.loop.run_until_complete(self._client.balance())
+        return self._run(self._client.balance())
     
     def opened_deals(self) -> list[dict]:
         "Returns a list of all the opened deals as dictionaries"
-        return self.loop.run_until_complete(self._client.opened_deals())
+        return self._run(self._client.opened_deals())
     
     def closed_deals(self) -> list[dict]:
         "Returns a list of all the closed deals as dictionaries"
-        return self.loop.run_until_complete(self._client.closed_deals())      
+        return self._run(self._client.closed_deals())      
     
     def clear_closed_deals(self) -> None:
         "Removes all the closed deals from memory, this function doesn't return anything"
-        self.loop.run_until_complete(self._client.clear_closed_deals())
+        self._run(self._client.clear_closed_deals())
         
-    def payout(self, asset: None | str | list[str] = None) -> dict | list[str] | int:
-        "Returns a dict of asset | payout for each asset, if 'asset' is not None then it will return the payout of the asset or a list of the payouts for each asset it was passed"
-        return self.loop.run_until_complete(self._client.payout(asset))
+    def payout(self, asset: None | str | list[str] | set[str] = None) -> dict | list[str] | int:
+        "Returns a dict of asset | payout for each asset, if 'asset' is not None then it will return the payout of the asset, a list of the payouts for each asset of a list or a dict of asset | payout for a set. The payout table is reused for 'Config.payout_ttl' seconds"
+        # A fresh cached table is read here directly, without a round trip through the loop thread
+        payout = self._client._cached_payout()
+        if payout is None:
+            return self._run(self._client.payout(asset))
+        return _select_payout(payout, asset)
     
     def history(self, asset: str, period: int) -> list[dict]:
         "Returns a list of dictionaries containing the latest data available for the specified asset starting from 'period', the data is in the same format as the returned data of the 'get_candles' function."
-        return self.loop.run_until_complete(self._client.history(asset, period))
+        return self._run(self._client.history(asset, period))
 
     def subscribe_symbol(self, asset: str) -> SyncSubscription:
         """Returns a sync iterator over the associated asset, it will return real time raw candles and will return new candles while the 'PocketOption' class is loaded if the class is droped then the iterator will fail"""
-        return SyncSubscription(self.loop.run_until_complete(self._client._subscribe_symbol_inner(asset)))
+        return SyncSubscription(self._run(self._client._subscribe_symbol_inner(asset)))
+
+    def subscribe_symbol_prefetch(self, asset: str, maxsize: int = 128) -> SyncPrefetchingSubscription:
+        """
+        Like `subscribe_symbol`, but a background thread receives and parses up to `maxsize` updates ahead of time while the
+        current one is processed. Call `close()` on the iterator (or use it in a `with` block) to stop the thread.
+        """
+        return SyncPrefetchingSubscription(self._run(self._client._subscribe_symbol_inner(asset)), maxsize)
+
+    def subscribe_symbol_close(self, asset: str) -> SyncCloseSubscription:
+        """Returns a sync iterator over `(timestamp, close)` tuples for the associated asset, a lighter version of `subscribe_symbol` for when only the close price is needed"""
+        return SyncCloseSubscription(self._run(self._client._subscribe_symbol_close_inner(asset)))
 
     def subscribe_symbol_chuncked(self, asset: str, chunck_size: int) -> SyncSubscription:
         """Returns a sync iterator over the associated asset, it will return real time candles formed with the specified amount of raw candles and will return new candles while the 'PocketOption' class is loaded if the class is droped then the iterator will fail"""
-        return SyncSubscription(self.loop.run_until_complete(self._client._subscribe_symbol_chuncked_inner(asset, chunck_size)))
+        return SyncSubscription(self._run(self._client._subscribe_symbol_chuncked_inner(asset, chunck_size)))
     
+    def subscribe_symbol_chuncked_np(self, asset: str, chunck_size: int, batch_n: int = 64) -> SyncNumpySubscription:
+        """
+        Same as `subscribe_symbol_chuncked` but yields numpy structured arrays of up to `batch_n` candles (`time`, `open`,
+        `high`, `low` and `close` fields) built directly over the bytes sent by Rust, without JSON parsing nor a dict per candle.
+        Requires `numpy`.
+        """
+        # Fails before subscribing when numpy is missing
+        candle_dtype()
+        return SyncNumpySubscription(self._run(self._client._subscribe_symbol_chuncked_buffer_inner(asset, chunck_size)), batch_n)
+
     def subscribe_symbol_timed(self, asset: str, time: timedelta) -> SyncSubscription:
         """
         Returns a sync iterator over the associated asset, it will return real time candles formed with candles ranging from time `start_time` to `start_time` + `time` allowing users to get the latest candle of `time` duration and will return new candles while the 'PocketOption' class is loaded if the class is droped then the iterator will fail
         Please keep in mind the iterator won't return a new candle exactly each `time` duration, there could be a small delay and imperfect timestamps
         """
-        return SyncSubscription(self.loop.run_until_complete(self._client._subscribe_symbol_timed_inner(asset, time)))
+        return SyncSubscription(self._run(self._client._subscribe_symbol_timed_inner(asset, time)))
     
-    def send_raw_message(self, message: str) -> None:
+    def send_raw_message(self, message: str | bytes) -> None:
         """
         Sends a raw WebSocket message without waiting for a response.
         
         Args:
-            message: Raw WebSocket message to send (e.g., '42["ping"]')
+            message: Raw WebSocket message to send (e.g., '42["ping"]'), `bytes` and `bytearray` are sent as is and must hold UTF-8 text
             
         Example:
             ```python
@@ -221,15 +615,22 @@ class PocketOption:
             client.send_raw_message('42["ping"]')
             ```
         """
-        self.loop.run_until_complete(self._client.send_raw_message(message))
+        self._run(self._client.send_raw_message(message))
+
+    def send_raw_message_nowait(self, message: str | bytes) -> None:
+        """
+        Queues a raw WebSocket message and returns immediately, without running the event loop.
+        Raises `ValueError` if the sending queue is full.
+        """
+        self._client.send_raw_message_nowait(message)
         
-    def create_raw_order(self, message: str, validator: Validator) -> str:
+    def create_raw_order(self, message: str | bytes, validator: Validator) -> str:
         """
         Sends a raw WebSocket message and waits for a validated response.
         
         Args:
-            message: Raw WebSocket message to send
-            validator: Validator instance to validate the response
+            message: Raw WebSocket message to send, `str`, `bytes` or `bytearray`
+            validator: Validator instance, or a spec tuple like `("starts_with", "451-")`, to validate the response
             
         Returns:
             str: The first message that matches the validator's conditions
@@ -246,16 +647,17 @@ class PocketOption:
             )
             ```
         """
-        return self.loop.run_until_complete(self._client.create_raw_order(message, validator))
+        # Blocks on the Rust runtime directly, there is nothing to run concurrently on the loop
+        return self._create_raw_order_sync(message, validator)
         
-    def create_raw_order_with_timout(self, message: str, validator: Validator, timeout: timedelta) -> str:
+    def create_raw_order_with_timout(self, message: str | bytes, validator: Validator, timeout: timedelta | float) -> str:
         """
         Similar to create_raw_order but with a timeout.
         
         Args:
-            message: Raw WebSocket message to send
-            validator: Validator instance to validate the response
-            timeout: Maximum time to wait for a valid response
+            message: Raw WebSocket message to send, `str`, `bytes` or `bytearray`
+            validator: Validator instance, or a spec tuple like `("starts_with", "451-")`, to validate the response
+            timeout: Maximum time to wait for a valid response, a `timedelta` or seconds
             
         Returns:
             str: The first message that matches the validator's conditions
@@ -280,22 +682,23 @@ class PocketOption:
                 print("Operation timed out")
             ```
         """
-        return self.loop.run_until_complete(self._client.create_raw_order_with_timeout(message, validator, timeout))
+        return self._run(self._client.create_raw_order_with_timout(message, validator, timeout))
     
-    def create_raw_order_with_timeout_and_retry(self, message: str, validator: Validator, timeout: timedelta) -> str:
+    def create_raw_order_with_timeout_and_retry(self, message: str | bytes, validator: Validator, timeout: timedelta | float, retry_policy: RetryPolicy | None = None) -> str:
         """
         Similar to create_raw_order_with_timout but with automatic retry on failure.
         
         Args:
-            message: Raw WebSocket message to send
-            validator: Validator instance to validate the response
-            timeout: Maximum time to wait for each attempt
+            message: Raw WebSocket message to send, `str`, `bytes` or `bytearray`
+            validator: Validator instance, or a spec tuple like `("starts_with", "451-")`, to validate the response
+            timeout: Maximum time to wait for a valid response across every attempt, a `timedelta` or seconds
+            retry_policy: Optional `RetryPolicy`, retries with jittered exponential backoff instead of the client's built in retries
             
         Returns:
             str: The first message that matches the validator's conditions
             
         Notes:
-            - Uses exponential backoff for retries
+            - Retries once by default, or as configured by `retry_policy`, all the attempts share `timeout`
             - More resilient to temporary network issues
             - Suitable for important operations that must succeed
             
@@ -317,19 +720,19 @@ class PocketOption:
             )
             ```
         """
-        return self.loop.run_until_complete(self._client.create_raw_order_with_timeout_and_retry(message, validator, timeout))
+        return self._run(self._client.create_raw_order_with_timeout_and_retry(message, validator, timeout, retry_policy))
  
-    def create_raw_iterator(self, message: str, validator: Validator, timeout: timedelta | None = None) -> SyncSubscription:
+    def create_raw_iterator(self, message: str | bytes, validator: Validator, timeout: timedelta | float | None = None) -> SyncRawSubscription:
         """
         Creates a synchronous iterator that yields validated WebSocket messages.
         
         Args:
-            message: Initial WebSocket message to send
-            validator: Validator instance to filter incoming messages
-            timeout: Optional timeout for the entire stream
+            message: Initial WebSocket message to send, `str`, `bytes` or `bytearray`
+            validator: Validator instance, or a spec tuple like `("starts_with", "451-")`, to filter incoming messages
+            timeout: Optional timeout for the entire stream, a `timedelta` or seconds
             
         Returns:
-            SyncSubscription yielding validated messages
+            SyncRawSubscription yielding the validated messages as strings
             
         Example:
             ```python
@@ -358,11 +761,11 @@ class PocketOption:
             - If timeout is None, the iterator will continue indefinitely
             - The stream can be stopped by breaking out of the loop
         """
-        return SyncSubscription(self.loop.run_until_complete(self._client.create_raw_iterator(message, validator, timeout)))
+        return SyncRawSubscription(self._run(self._client.create_raw_iterator(message, validator, timeout)))
 
-    def get_server_time(self) -> int:
-        """Returns the current server time as a UNIX timestamp"""
-        return self.loop.run_until_complete(self._client.get_server_time())
+    def get_server_time(self, force_refresh: bool = False) -> int:
+        """Returns the current server time as a UNIX timestamp, `force_refresh` skips the cached server clock offset"""
+        return self._run(self._client.get_server_time(force_refresh))
 
     def is_demo(self) -> bool:
         """
@@ -392,4 +795,8 @@ class PocketOption:
                 return client.buy(asset, amount, duration)
             ```
         """
-        return self.loop.run_until_complete(self._client.is_demo())
+        return self._run(self._client.is_demo())
+
+    def invalidate_session(self) -> None:
+        """Clears the values cached for the current session (the account type used by `is_demo` and the payout table)"""
+        self._client.invalidate_session()
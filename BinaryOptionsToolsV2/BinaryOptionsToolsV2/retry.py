@@ -0,0 +1,30 @@
+"""
+Retry policy used by `create_raw_order_with_timeout_and_retry`.
+"""
+
+from asyncio import TimeoutError as _AsyncTimeoutError
+from random import uniform
+from typing import NamedTuple
+
+
+class RetryPolicy(NamedTuple):
+    """
+    Exponential backoff with full jitter.
+
+    The wait before the retry number `attempt` (starting at 0) is drawn uniformly
+    from `[0, min(cap, base * 2 ** attempt)]` seconds, so concurrent callers that
+    failed together don't all retry at the same time.
+    Only the exceptions listed in `retryable_errors` are retried, every error raised
+    by the Rust client is a `ValueError` and a timed out attempt a `TimeoutError`.
+    """
+    # Seconds
+    base: float = 0.1
+    # Seconds
+    cap: float = 5.0
+    max_attempts: int = 5
+    # `asyncio.TimeoutError` is only an alias of `TimeoutError` since python 3.11
+    retryable_errors: tuple = (TimeoutError, _AsyncTimeoutError, ValueError)
+
+    def delay(self, attempt: int) -> float:
+        """Returns the time in seconds to wait before the retry number `attempt`"""
+        return uniform(0, min(self.cap, self.base * 2 ** attempt))
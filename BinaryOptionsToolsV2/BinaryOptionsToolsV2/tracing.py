@@ -1,25 +1,70 @@
-import json
 from BinaryOptionsToolsV2 import start_tracing
 from BinaryOptionsToolsV2 import Logger as RustLogger
 from BinaryOptionsToolsV2 import LogBuilder as RustLogBuilder
 
+from collections import deque
 from datetime import timedelta
 
 class LogSubscription:
-    def __init__(self, subscription):
+    __slots__ = ("subscription", "batch_size", "_buffer", "_next_batch", "_next_batch_sync")
+
+    def __init__(self, subscription, batch_size: int = 64):
+        """
+        Iterable (syncronous and asyncronous) over the logs, as dicts or as JSON strings for the raw
+        iterators (the dicts are built by Rust, nothing is parsed here). Up to `batch_size` logs
+        already received are read from Rust at once and handed out one by one.
+        """
         self.subscription = subscription
+        self.batch_size = batch_size
+        self._buffer = deque()
+        # Bound once, the refills run for every batch of the stream
+        self._next_batch = subscription.next_batch
+        self._next_batch_sync = subscription.next_batch_sync
         
-    def __aiter__(self):
-        return self
+    async def __aiter__(self):
+        # Async generator, so the loop only reads local variables
+        buffer = self._buffer
+        next_batch = self._next_batch
+        batch_size = self.batch_size
+        while True:
+            while buffer:
+                yield buffer.popleft()
+            try:
+                buffer.extend(await next_batch(batch_size, 0))
+            except StopAsyncIteration:
+                return
         
     async def __anext__(self):
-        return json.loads(await anext(self.subscription))
+        buffer = self._buffer
+        if not buffer:
+            buffer.extend(await self._next_batch(self.batch_size, 0))
+        return buffer.popleft()
     
     def __iter__(self):
-        return self
+        # Generator, so the loop only reads local variables
+        buffer = self._buffer
+        next_batch = self._next_batch_sync
+        batch_size = self.batch_size
+        while True:
+            while buffer:
+                yield buffer.popleft()
+            try:
+                buffer.extend(next_batch(batch_size, 0))
+            except StopIteration:
+                return
         
     def __next__(self):
-        return json.loads(next(self.subscription))        
+        buffer = self._buffer
+        if not buffer:
+            buffer.extend(self._next_batch_sync(self.batch_size, 0))
+        return buffer.popleft()
+
+    def drain(self) -> list[dict | str]:
+        """Returns the logs already read from Rust that weren't iterated yet, without waiting for new ones"""
+        buffer = self._buffer
+        logs = list(buffer)
+        buffer.clear()
+        return logs
 
 
 def start_logs(path: str, level: str = "DEBUG", terminal: bool = True, layers: list = None):
@@ -51,6 +96,8 @@ class Logger:
 
     Attributes:
         logger (RustLogger): The underlying RustLogger instance.
+
+    Messages that aren't `str` are converted with `str(message)` on the Rust side.
     """
     def __init__(self):
         self.logger = RustLogger()
@@ -62,7 +109,30 @@ class Logger:
         Args:
             message (str): The message to log.
         """
-        self.logger.debug(str(message))
+        self.logger.debug(message)
+
+    def enabled_for(self, level: str = "DEBUG") -> bool:
+        """
+        Check if messages of a level are recorded by any of the configured logs.
+
+        Use it to skip building expensive messages:
+            if logger.enabled_for("DEBUG"):
+                logger.debug(f"processed {n} items in {t:.3f}s")
+
+        Args:
+            level (str): The level to check ("DEBUG", "INFO", "WARN" or "ERROR").
+        """
+        return self.logger.enabled_for(level)
+
+    def debug_lazy(self, build):
+        """
+        Log a debug message built by `build` only when debug messages are recorded.
+
+        Args:
+            build (Callable[[], str]): Function returning the message to log.
+        """
+        if self.logger.enabled_for("DEBUG"):
+            self.logger.debug(build())
 
     def info(self, message):
         """
@@ -71,7 +141,7 @@ class Logger:
         Args:
             message (str): The message to log.
         """
-        self.logger.info(str(message))
+        self.logger.info(message)
 
     def warn(self, message):
         """
@@ -80,7 +150,7 @@ class Logger:
         Args:
             message (str): The message to log.
         """
-        self.logger.warn(str(message))
+        self.logger.warn(message)
 
     def error(self, message):
         """
@@ -89,7 +159,7 @@ class Logger:
         Args:
             message (str): The message to log.
         """
-        self.logger.error(str(message))
+        self.logger.error(message)
 
 
 class LogBuilder:
@@ -102,18 +172,22 @@ class LogBuilder:
     def __init__(self):
         self.builder = RustLogBuilder()
 
-    def create_logs_iterator(self, level: str = "DEBUG", timeout: None | timedelta = None) -> LogSubscription:
+    def create_logs_iterator(self, level: str = "DEBUG", timeout: None | timedelta = None, batch_size: int = 64, raw: bool = False) -> LogSubscription:
         """
         Create a new logs iterator with the specified level and timeout.
 
         Args:
             level (str): The logging level (default is "DEBUG").
             timeout (None | timedelta): Optional timeout for the iterator.
+            batch_size (int): Maximum number of logs read from Rust at once (default is 64).
+            raw (bool): Yield every log as its JSON string instead of a dict, to forward it elsewhere (default is False).
 
         Returns:
             StreamLogsIterator: A new StreamLogsIterator instance that supports both asyncronous and syncronous iterators.
         """
-        return LogSubscription(self.builder.create_logs_iterator(level, timeout))
+        if raw:
+            return LogSubscription(self.builder.create_logs_iterator(level, timeout), batch_size)
+        return LogSubscription(self.builder.create_logs_dict_iterator(level, timeout), batch_size)
 
     def log_file(self, path: str = "logs.log", level: str = "DEBUG"):
         """
@@ -1,5 +1,8 @@
+from functools import lru_cache
 from typing import List
 
+import ast
+
 class Validator:
     """
     A high-level wrapper for RawValidator that provides message validation functionality.
@@ -20,11 +23,44 @@ class Validator:
         assert combined.check("Hello World") == True
         ```
     """
+    # The clients read `_validator` directly instead of going through `raw_validator`
+    __slots__ = ("_validator",)
     
     def __init__(self):
         """Creates a default validator that accepts all messages."""
-        from BinaryOptionsToolsV2 import RawValidator
-        self._validator = RawValidator()
+        self._validator = _raw_validator()()
+
+    @classmethod
+    def _wrap(cls, raw) -> 'Validator':
+        # Skips `__init__`, which would build a RawValidator only to replace it
+        v = cls.__new__(cls)
+        v._validator = raw
+        return v
+
+    @staticmethod
+    def from_spec(kind: str, *args) -> 'Validator':
+        """
+        Creates a validator from a `(kind, *args)` spec, like `("starts_with", "451-")`.
+        
+        Validators built from the same spec are shared (see `_cached`), so calling this
+        in a loop only builds the underlying RawValidator once.
+        
+        Args:
+            kind: One of "regex", "starts_with", "ends_with", "contains" or "json_field"
+            *args: Arguments of the matching factory method
+            
+        Returns:
+            Validator matching the spec
+            
+        Example:
+            ```python
+            validator = Validator.from_spec("starts_with", '451-["signals/load"')
+            assert validator is Validator.starts_with('451-["signals/load"')
+            ```
+        """
+        if kind not in _CACHED_KINDS:
+            raise ValueError(f"Unknown validator kind {kind!r}, expected one of {sorted(_CACHED_KINDS)}")
+        return getattr(Validator, kind)(*args)
         
     @staticmethod
     def regex(pattern: str) -> 'Validator':
@@ -45,10 +81,7 @@ class Validator:
             assert validator.check("abc") == False
             ```
         """
-        from BinaryOptionsToolsV2 import RawValidator
-        v = Validator()
-        v._validator = RawValidator.regex(pattern)
-        return v
+        return _cached("regex", pattern)
         
     @staticmethod
     def starts_with(prefix: str) -> 'Validator':
@@ -61,10 +94,7 @@ class Validator:
         Returns:
             Validator that matches messages starting with prefix
         """
-        from BinaryOptionsToolsV2 import RawValidator
-        v = Validator()
-        v._validator = RawValidator.starts_with(prefix)
-        return v
+        return _cached("starts_with", prefix)
         
     @staticmethod
     def ends_with(suffix: str) -> 'Validator':
@@ -77,10 +107,7 @@ class Validator:
         Returns:
             Validator that matches messages ending with suffix
         """
-        from BinaryOptionsToolsV2 import RawValidator
-        v = Validator()
-        v._validator = RawValidator.ends_with(suffix)
-        return v
+        return _cached("ends_with", suffix)
         
     @staticmethod
     def contains(substring: str) -> 'Validator':
@@ -93,10 +120,33 @@ class Validator:
         Returns:
             Validator that matches messages containing substring
         """
-        from BinaryOptionsToolsV2 import RawValidator
-        v = Validator()
-        v._validator = RawValidator.contains(substring)
-        return v
+        return _cached("contains", substring)
+        
+    @staticmethod
+    def json_field(pointer: str, value) -> 'Validator':
+        """
+        Creates a validator that checks if a field of a JSON message equals a value.
+        
+        The message is parsed and compared on the Rust side, so unlike `custom` validators
+        no Python code runs for every incoming message. The Socket.IO packet prefix
+        (like the `42` in `42["event", {...}]` or the `451-` of binary events) is ignored.
+        
+        Args:
+            pointer: JSON pointer (RFC 6901) to the field, like "/1/requestId"
+            value: Expected value, any JSON serializable object
+            
+        Returns:
+            Validator that matches JSON messages where the field equals value
+            
+        Example:
+            ```python
+            validator = Validator.json_field("/1/requestId", "abc")
+            assert validator.check('42["successopenOrder",{"requestId":"abc"}]') == True
+            assert validator.check('42["successopenOrder",{"requestId":"xyz"}]') == False
+            ```
+        """
+        from BinaryOptionsToolsV2._json import dumps
+        return _cached("json_field", pointer, dumps(value))
         
     @staticmethod
     def ne(validator: 'Validator') -> 'Validator':
@@ -117,10 +167,7 @@ class Validator:
             assert v.check("error occurred") == False
             ```
         """
-        from BinaryOptionsToolsV2 import RawValidator
-        v = Validator()
-        v._validator = RawValidator.ne(validator._validator)
-        return v
+        return _combined("ne", validator)
         
     @staticmethod
     def all(validators: List['Validator']) -> 'Validator':
@@ -133,6 +180,9 @@ class Validator:
         Returns:
             Validator that returns True only if all input validators return True
             
+        The validators are checked cheapest first (prefix/suffix, contains, regex, json, custom)
+        rather than in the given order, custom validators may not be called at all.
+            
         Example:
             ```python
             # Match messages that start with "Hello" and end with "World"
@@ -144,10 +194,7 @@ class Validator:
             assert v.check("Hello Beautiful") == False
             ```
         """
-        from BinaryOptionsToolsV2 import RawValidator
-        v = Validator()
-        v._validator = RawValidator.all([v._validator for v in validators])
-        return v
+        return _combined("all", *validators)
         
     @staticmethod
     def any(validators: List['Validator']) -> 'Validator':
@@ -160,6 +207,9 @@ class Validator:
         Returns:
             Validator that returns True if any input validator returns True
             
+        The validators are checked cheapest first (prefix/suffix, contains, regex, json, custom)
+        rather than in the given order, custom validators may not be called at all.
+            
         Example:
             ```python
             # Match messages containing either "success" or "completed"
@@ -172,16 +222,44 @@ class Validator:
             assert v.check("in progress") == False
             ```
         """
-        from BinaryOptionsToolsV2 import RawValidator
-        v = Validator()
-        v._validator = RawValidator.any([v._validator for v in validators])
-        return v
+        return _combined("any", *validators)
+    
+    @staticmethod
+    def expr(expression: str) -> 'Validator':
+        """
+        Creates a validator from an expression combining the other validators.
+        
+        The expression uses python syntax: the `regex`, `starts_with`, `ends_with`, `contains`
+        and `json_field` functions with literal arguments, combined with `and`, `or`, `not`
+        and parentheses. It's compiled once into the same validators as `all`, `any` and `ne`,
+        so it's checked entirely in Rust, unlike a `custom` validator doing the same checks.
+        
+        Args:
+            expression: Expression to compile
+            
+        Returns:
+            Validator equivalent to the expression
+            
+        Raises:
+            ValueError: If the expression is invalid or uses anything else than the elements above
+            
+        Example:
+            ```python
+            v = Validator.expr("starts_with('451-') and (contains('successopenOrder') or contains('failopenOrder'))")
+            assert v.check('451-["successopenOrder",{"_placeholder":true,"num":0}]') == True
+            assert v.check('451-["updateStream",{"_placeholder":true,"num":0}]') == False
+            ```
+        """
+        return _compile_expr(expression)
     
     @staticmethod
     def custom(func: callable) -> 'Validator':
         """
         Creates a validator that uses a custom function for validation.
         
+        Every message is checked by calling back into python, prefer `expr` for
+        anything that can be written with the other validators.
+        
         IMPORTANT SAFETY AND USAGE NOTES:
         1. The provided function MUST:
             - Take exactly one string parameter
@@ -240,22 +318,34 @@ class Validator:
                 print("This will never be reached")
             ```
         """
-        from BinaryOptionsToolsV2 import RawValidator
-        v = Validator()
-        v._validator = RawValidator.custom(func)
-        return v
+        return Validator._wrap(_raw_validator().custom(func))
         
-    def check(self, message: str) -> bool:
+    def check(self, message: str | bytes) -> bool:
         """
         Checks if a message matches this validator's conditions.
         
         Args:
-            message: String to validate
+            message: String to validate, UTF-8 encoded `bytes` or `bytearray` are accepted
+                too and checked without being decoded to `str` first
             
         Returns:
             True if message matches the validator's conditions, False otherwise
         """
         return self._validator.check(message)
+
+    def check_many(self, messages: List[str | bytes]) -> List[bool]:
+        """
+        Checks several messages at once, prefer it over calling `check` in a loop.
+        
+        The whole list is checked by Rust in a single call, instead of one call per message.
+        
+        Args:
+            messages: Strings (or UTF-8 encoded bytes) to validate
+            
+        Returns:
+            List with the result of `check` for every message, in the same order
+        """
+        return self._validator.check_many(messages)
         
     @property
     def raw_validator(self):
@@ -265,4 +355,69 @@ class Validator:
         This is mainly used internally by the library but can be useful
         for advanced use cases.
         """
-        return self._validator
\ No newline at end of file
+        return self._validator
+
+
+_RawValidator = None
+
+
+def _raw_validator():
+    # Imported on first use instead of at the top of the module, where it would be a
+    # circular import, and kept so the following calls skip the import statement
+    global _RawValidator
+    if _RawValidator is None:
+        from BinaryOptionsToolsV2 import RawValidator as _RawValidator
+    return _RawValidator
+
+
+_CACHED_KINDS = frozenset(("regex", "starts_with", "ends_with", "contains", "json_field"))
+
+
+@lru_cache(maxsize=256)
+def _cached(kind: str, *args) -> Validator:
+    # Validators are immutable, so the ones built from the same arguments can be shared.
+    # This keeps validators created inline in a loop (like `Validator.starts_with(...)` on every call)
+    # from building the same RawValidator, and compiling the same regex, every time.
+    return Validator._wrap(getattr(_raw_validator(), kind)(*args))
+
+
+@lru_cache(maxsize=256)
+def _combined(kind: str, *validators: Validator) -> Validator:
+    # Combinations of the same validator objects are shared too, validators hash by identity
+    # so building `all`/`any`/`ne` of cached validators inline in a loop only builds it once.
+    # The Rust side unwraps the validators while iterating, no intermediate list is built
+    raw = _raw_validator()
+    if kind == "ne":
+        return Validator._wrap(raw.ne(validators[0]._validator))
+    return Validator._wrap(getattr(raw, kind)(validators))
+
+
+@lru_cache(maxsize=256)
+def _compile_expr(expression: str) -> Validator:
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid validator expression {expression!r}, {e.msg}") from None
+    return _build_expr(tree.body, expression)
+
+
+def _build_expr(node: ast.AST, expression: str) -> Validator:
+    # Turns the parsed expression into validators, anything else than the
+    # factories of `_CACHED_KINDS`, `and`, `or` and `not` is rejected
+    if isinstance(node, ast.BoolOp):
+        validators = [_build_expr(value, expression) for value in node.values]
+        return Validator.all(validators) if isinstance(node.op, ast.And) else Validator.any(validators)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return Validator.ne(_build_expr(node.operand, expression))
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _CACHED_KINDS
+        and not node.keywords
+    ):
+        try:
+            args = [ast.literal_eval(arg) for arg in node.args]
+        except ValueError:
+            raise ValueError(f"Arguments of {node.func.id} must be literals in validator expression {expression!r}") from None
+        return getattr(Validator, node.func.id)(*args)
+    raise ValueError(f"Unsupported element {ast.unparse(node)!r} in validator expression {expression!r}")
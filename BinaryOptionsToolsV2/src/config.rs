@@ -8,27 +8,31 @@ use binary_options_tools::pocketoption::types::data::PocketData;
 
 use crate::error::BinaryResultPy;
 
-#[pyclass]
-#[derive(Clone, Default)]
+/// Immutable connection settings handed over to the Rust client.
+/// All the values are set once through the constructor.
+#[pyclass(frozen)]
+#[derive(Clone)]
 pub struct PyConfig {
-    #[pyo3(get, set)]
+    #[pyo3(get)]
     pub max_allowed_loops: u32,
-    #[pyo3(get, set)]
+    #[pyo3(get)]
     pub sleep_interval: u64,
-    #[pyo3(get, set)]
+    #[pyo3(get)]
     pub reconnect_time: u64,
-    #[pyo3(get, set)]
+    /// Deprecated, kept so existing code still builds: the client always waits 500ms
+    /// after connecting, see `build`
+    #[pyo3(get)]
     pub connection_initialization_timeout_secs: u64,
-    #[pyo3(get, set)]
+    #[pyo3(get)]
     pub timeout_secs: u64,
-    #[pyo3(get, set)]
+    #[pyo3(get)]
     pub urls: Vec<String>,
+    #[pyo3(get)]
+    pub read_buffer_size: usize,
 }
 
-#[pymethods]
-impl PyConfig {
-    #[new]
-    pub fn new() -> Self {
+impl Default for PyConfig {
+    fn default() -> Self {
         Self {
             max_allowed_loops: 100,
             sleep_interval: 100,
@@ -36,9 +40,43 @@ impl PyConfig {
             connection_initialization_timeout_secs: 30,
             timeout_secs: 30,
             urls: Vec::new(),
+            read_buffer_size: 16 * 1024,
         }
     }
+}
 
+#[pymethods]
+impl PyConfig {
+    #[new]
+    #[pyo3(signature = (
+        *,
+        max_allowed_loops = 100,
+        sleep_interval = 100,
+        reconnect_time = 5,
+        connection_initialization_timeout_secs = 30,
+        timeout_secs = 30,
+        urls = Vec::new(),
+        read_buffer_size = 16 * 1024
+    ))]
+    pub fn new(
+        max_allowed_loops: u32,
+        sleep_interval: u64,
+        reconnect_time: u64,
+        connection_initialization_timeout_secs: u64,
+        timeout_secs: u64,
+        urls: Vec<String>,
+        read_buffer_size: usize,
+    ) -> Self {
+        Self {
+            max_allowed_loops,
+            sleep_interval,
+            reconnect_time,
+            connection_initialization_timeout_secs,
+            timeout_secs,
+            urls,
+            read_buffer_size,
+        }
+    }
 }
 
 impl PyConfig {
@@ -54,6 +92,11 @@ impl PyConfig {
         .sleep_interval(self.sleep_interval)
         .reconnect_time(self.reconnect_time)
         .timeout(Duration::from_secs(self.timeout_secs))
+        // Required by the builder, the client sleeps for this long after starting so it
+        // uses the same value as `PocketOption::new` instead of the seconds based setting
+        .connection_initialization_timeout(Duration::from_millis(500))
+        .read_buffer_size(Some(self.read_buffer_size))
+        .extra(())
         .default_connection_url(HashSet::from_iter(urls.map_err(|e| {
             BinaryOptionsToolsError::from(e)
         })?));
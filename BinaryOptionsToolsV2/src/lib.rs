@@ -9,7 +9,9 @@ mod validator;
 mod config;
 
 use config::PyConfig;
-use logs::{start_tracing, LogBuilder, Logger, StreamLogsIterator, StreamLogsLayer};
+use logs::{
+    start_tracing, LogBuilder, Logger, StreamLogsDictIterator, StreamLogsIterator, StreamLogsLayer,
+};
 use pocketoption::{RawPocketOption, RawStreamIterator, StreamIterator};
 use pyo3::prelude::*;
 use validator::RawValidator;
@@ -18,6 +20,7 @@ use validator::RawValidator;
 #[pyo3(name = "BinaryOptionsToolsV2")]
 fn BinaryOptionsTools(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<StreamLogsIterator>()?;
+    m.add_class::<StreamLogsDictIterator>()?;
     m.add_class::<StreamLogsLayer>()?;
     m.add_class::<RawPocketOption>()?;
     m.add_class::<Logger>()?;
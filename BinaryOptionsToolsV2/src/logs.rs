@@ -1,15 +1,27 @@
-use std::{fs::OpenOptions, io::Write, sync::Arc};
+use std::{
+    fs::OpenOptions,
+    io::Write,
+    sync::{
+        atomic::{AtomicU8, Ordering},
+        Arc,
+    },
+};
 
 use binary_options_tools::{
     error::BinaryOptionsResult,
-    stream::{stream_logs_layer, RecieverStream},
+    stream::{stream_logs_layer, stream_logs_layer_values, RecieverStream},
 };
 use chrono::Duration;
 use futures_util::{
     stream::{BoxStream, Fuse},
     StreamExt,
 };
-use pyo3::{pyclass, pyfunction, pymethods, Bound, Py, PyAny, PyResult, Python};
+use pyo3::{
+    pyclass, pyfunction, pymethods,
+    types::{PyAnyMethods, PyDict, PyDictMethods, PyList, PyListMethods, PyString, PyStringMethods},
+    Bound, FromPyObject, IntoPyObjectExt, Py, PyAny, PyObject, PyResult, Python,
+};
+use serde_json::Value;
 use pyo3_async_runtimes::tokio::future_into_py;
 use tokio::sync::Mutex;
 use tracing::{debug, instrument, level_filters::LevelFilter, warn, Level};
@@ -20,10 +32,41 @@ use tracing_subscriber::{
     Layer, Registry,
 };
 
-use crate::{error::BinaryErrorPy, runtime::get_runtime, stream::next_stream};
+use crate::{
+    error::BinaryErrorPy,
+    runtime::get_runtime,
+    stream::{next_stream, next_stream_batch},
+};
 
 const TARGET: &str = "Python";
 
+/// Most verbose level any configured layer records, as `level_rank`, so Python can skip
+/// building messages that would be discarded. Nothing is recorded until the logs are started.
+static MAX_LEVEL: AtomicU8 = AtomicU8::new(0);
+
+fn level_rank(level: LevelFilter) -> u8 {
+    match level.into_level() {
+        None => 0,
+        Some(Level::ERROR) => 1,
+        Some(Level::WARN) => 2,
+        Some(Level::INFO) => 3,
+        Some(Level::DEBUG) => 4,
+        Some(Level::TRACE) => 5,
+    }
+}
+
+/// Stores the most verbose level of `layers`, a layer without a level hint records everything
+fn set_max_level<'a>(
+    layers: impl IntoIterator<Item = &'a Box<dyn Layer<Registry> + Send + Sync>>,
+    extra: LevelFilter,
+) {
+    let max = layers
+        .into_iter()
+        .map(|layer| layer.max_level_hint().unwrap_or(LevelFilter::TRACE))
+        .fold(extra, LevelFilter::max);
+    MAX_LEVEL.store(level_rank(max), Ordering::Relaxed);
+}
+
 #[pyfunction]
 pub fn start_tracing(
     path: String,
@@ -45,6 +88,8 @@ pub fn start_tracing(
         .into_iter()
         .flat_map(|l| Arc::try_unwrap(l.layer))
         .collect::<Vec<Box<dyn Layer<Registry> + Send + Sync>>>();
+    // The error file only records warnings and errors
+    set_max_level(&layers, level.max(LevelFilter::WARN));
     layers.push(default);
     println!("Length of layers: {}", layers.len());
     let subscriber = tracing_subscriber::registry()
@@ -126,7 +171,163 @@ impl StreamLogsIterator {
     fn __next__<'py>(&'py self, py: Python<'py>) -> PyResult<String> {
         let runtime = get_runtime(py)?;
         let stream = self.stream.clone();
-        runtime.block_on(next_stream(stream, true))
+        py.allow_threads(|| runtime.block_on(next_stream(stream, true)))
+    }
+
+    /// Awaits the next log and returns it together with every log that arrives
+    /// within `max_wait_ms`, up to `max_n` items.
+    #[pyo3(signature = (max_n = 64, max_wait_ms = 0))]
+    fn next_batch<'py>(
+        &self,
+        py: Python<'py>,
+        max_n: usize,
+        max_wait_ms: u64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let stream = self.stream.clone();
+        future_into_py(py, async move {
+            next_stream_batch(
+                stream,
+                max_n,
+                std::time::Duration::from_millis(max_wait_ms),
+                false,
+            )
+            .await
+        })
+    }
+
+    /// Blocking `next_batch`, the GIL is released while waiting.
+    #[pyo3(signature = (max_n = 64, max_wait_ms = 0))]
+    fn next_batch_sync(&self, py: Python<'_>, max_n: usize, max_wait_ms: u64) -> PyResult<Vec<String>> {
+        let runtime = get_runtime(py)?;
+        let stream = self.stream.clone();
+        py.allow_threads(|| {
+            runtime.block_on(next_stream_batch(
+                stream,
+                max_n,
+                std::time::Duration::from_millis(max_wait_ms),
+                true,
+            ))
+        })
+    }
+}
+
+type LogValueStream = Fuse<BoxStream<'static, BinaryOptionsResult<Value>>>;
+
+/// Like `StreamLogsIterator` but every log is handed to Python as a `dict`, built
+/// straight from the parsed log instead of a JSON string parsed again in Python
+#[pyclass]
+pub struct StreamLogsDictIterator {
+    stream: Arc<Mutex<LogValueStream>>,
+}
+
+#[pymethods]
+impl StreamLogsDictIterator {
+    fn __aiter__(slf: Py<Self>) -> Py<Self> {
+        slf
+    }
+
+    fn __iter__(slf: Py<Self>) -> Py<Self> {
+        slf
+    }
+
+    fn __anext__<'py>(&'py mut self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let stream = self.stream.clone();
+        future_into_py(py, async move {
+            let log = next_stream(stream, false).await?;
+            Python::with_gil(|py| json_to_py(py, &log))
+        })
+    }
+
+    fn __next__<'py>(&'py self, py: Python<'py>) -> PyResult<PyObject> {
+        let runtime = get_runtime(py)?;
+        let stream = self.stream.clone();
+        let log = py.allow_threads(|| runtime.block_on(next_stream(stream, true)))?;
+        json_to_py(py, &log)
+    }
+
+    /// Awaits the next log and returns it together with every log that arrives
+    /// within `max_wait_ms`, up to `max_n` items.
+    #[pyo3(signature = (max_n = 64, max_wait_ms = 0))]
+    fn next_batch<'py>(
+        &self,
+        py: Python<'py>,
+        max_n: usize,
+        max_wait_ms: u64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let stream = self.stream.clone();
+        future_into_py(py, async move {
+            let logs = next_stream_batch(
+                stream,
+                max_n,
+                std::time::Duration::from_millis(max_wait_ms),
+                false,
+            )
+            .await?;
+            Python::with_gil(|py| {
+                logs.iter()
+                    .map(|log| json_to_py(py, log))
+                    .collect::<PyResult<Vec<_>>>()?
+                    .into_py_any(py)
+            })
+        })
+    }
+
+    /// Blocking `next_batch`, the GIL is released while waiting.
+    #[pyo3(signature = (max_n = 64, max_wait_ms = 0))]
+    fn next_batch_sync(&self, py: Python<'_>, max_n: usize, max_wait_ms: u64) -> PyResult<Vec<PyObject>> {
+        let runtime = get_runtime(py)?;
+        let stream = self.stream.clone();
+        let logs = py.allow_threads(|| {
+            runtime.block_on(next_stream_batch(
+                stream,
+                max_n,
+                std::time::Duration::from_millis(max_wait_ms),
+                true,
+            ))
+        })?;
+        logs.iter().map(|log| json_to_py(py, log)).collect()
+    }
+}
+
+/// Converts a parsed log into the matching Python objects (`dict`, `list`, `str`, ...)
+fn json_to_py(py: Python<'_>, value: &Value) -> PyResult<PyObject> {
+    match value {
+        Value::Null => Ok(py.None()),
+        Value::Bool(value) => (*value).into_py_any(py),
+        Value::Number(number) => match (number.as_i64(), number.as_u64()) {
+            (Some(value), _) => value.into_py_any(py),
+            (None, Some(value)) => value.into_py_any(py),
+            (None, None) => number.as_f64().unwrap_or(f64::NAN).into_py_any(py),
+        },
+        Value::String(value) => value.as_str().into_py_any(py),
+        Value::Array(items) => {
+            let list = PyList::empty(py);
+            for item in items {
+                list.append(json_to_py(py, item)?)?;
+            }
+            list.into_py_any(py)
+        }
+        Value::Object(fields) => {
+            let dict = PyDict::new(py);
+            for (key, item) in fields {
+                dict.set_item(key.as_str(), json_to_py(py, item)?)?;
+            }
+            dict.into_py_any(py)
+        }
+    }
+}
+
+/// Converts the optional timeout of the logs iterators to a std `Duration`
+fn std_timeout(timeout: Option<Duration>) -> Option<std::time::Duration> {
+    match timeout {
+        Some(timeout) => match timeout.to_std() {
+            Ok(timeout) => Some(timeout),
+            Err(e) => {
+                warn!("Error converting duration to std, {e}");
+                None
+            }
+        },
+        None => None,
     }
 }
 
@@ -150,18 +351,10 @@ impl LogBuilder {
         level: String,
         timeout: Option<Duration>,
     ) -> StreamLogsIterator {
-        let timeout = match timeout {
-            Some(timeout) => match timeout.to_std() {
-                Ok(timeout) => Some(timeout),
-                Err(e) => {
-                    warn!("Error converting duration to std, {e}");
-                    None
-                }
-            },
-            None => None,
-        };
-        let (layer, inner_iter) =
-            stream_logs_layer(level.parse().unwrap_or(Level::DEBUG.into()), timeout);
+        let (layer, inner_iter) = stream_logs_layer(
+            level.parse().unwrap_or(Level::DEBUG.into()),
+            std_timeout(timeout),
+        );
         let stream = RecieverStream::to_stream_static(Arc::new(inner_iter))
             .boxed()
             .fuse();
@@ -172,6 +365,27 @@ impl LogBuilder {
         iter
     }
 
+    /// Same as `create_logs_iterator` but the iterator yields every log as a `dict`
+    #[pyo3(signature = (level = "DEBUG".to_string(), timeout = None))]
+    pub fn create_logs_dict_iterator(
+        &mut self,
+        level: String,
+        timeout: Option<Duration>,
+    ) -> StreamLogsDictIterator {
+        let (layer, inner_iter) = stream_logs_layer_values(
+            level.parse().unwrap_or(Level::DEBUG.into()),
+            std_timeout(timeout),
+        );
+        let stream = RecieverStream::to_stream_static(Arc::new(inner_iter))
+            .boxed()
+            .fuse();
+        let iter = StreamLogsDictIterator {
+            stream: Arc::new(Mutex::new(stream)),
+        };
+        self.layers.push(layer);
+        iter
+    }
+
     #[pyo3(signature = (path = "logs.log".to_string(), level = "DEBUG".to_string()))]
     pub fn log_file(&mut self, path: String, level: String) -> PyResult<()> {
         let logs = OpenOptions::new().append(true).create(true).open(path)?;
@@ -200,6 +414,7 @@ impl LogBuilder {
             .into());
         }
         self.build = true;
+        set_max_level(&self.layers, LevelFilter::OFF);
         let default = fmt::Layer::default().with_writer(NoneWriter).boxed();
         self.layers.push(default);
         let layers = self
@@ -215,6 +430,19 @@ impl LogBuilder {
 #[derive(Default)]
 pub struct Logger;
 
+/// Log message accepted from Python as any object, `str(message)` is only called
+/// when it isn't already a `str`.
+pub struct LogMessage(String);
+
+impl<'py> FromPyObject<'py> for LogMessage {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        if let Ok(text) = ob.downcast::<PyString>() {
+            return Ok(Self(text.to_str()?.to_owned()));
+        }
+        Ok(Self(ob.str()?.to_str()?.to_owned()))
+    }
+}
+
 #[pymethods]
 impl Logger {
     #[new]
@@ -222,23 +450,34 @@ impl Logger {
         Self
     }
 
+    /// Returns `false` when no layer records messages of `level`, a single atomic load
+    #[pyo3(signature = (level = "DEBUG".to_string()))]
+    pub fn enabled_for(&self, level: String) -> bool {
+        let level: LevelFilter = level.parse().unwrap_or(Level::DEBUG.into());
+        level_rank(level) <= MAX_LEVEL.load(Ordering::Relaxed)
+    }
+
     #[instrument(target = TARGET, skip(self, message))] // Use instrument for better tracing
-    pub fn debug(&self, message: String) {
+    pub fn debug(&self, message: LogMessage) {
+        let message = message.0;
         debug!(message);
     }
 
     #[instrument(target = TARGET, skip(self, message))]
-    pub fn info(&self, message: String) {
+    pub fn info(&self, message: LogMessage) {
+        let message = message.0;
         tracing::info!(message);
     }
 
     #[instrument(target = TARGET, skip(self, message))]
-    pub fn warn(&self, message: String) {
+    pub fn warn(&self, message: LogMessage) {
+        let message = message.0;
         tracing::warn!(message);
     }
 
     #[instrument(target = TARGET, skip(self, message))]
-    pub fn error(&self, message: String) {
+    pub fn error(&self, message: LogMessage) {
+        let message = message.0;
         tracing::error!(message);
     }
 }
@@ -1,27 +1,44 @@
+use std::collections::HashSet;
 use std::str;
 use std::sync::Arc;
-use std::time::Duration;
+use std::time::{Duration, Instant};
 
 use binary_options_tools::error::{BinaryOptionsResult, BinaryOptionsToolsError};
 use binary_options_tools::pocketoption::error::PocketResult;
 use binary_options_tools::pocketoption::pocket_client::PocketOption;
 use binary_options_tools::pocketoption::types::base::RawWebsocketMessage;
+use binary_options_tools::pocketoption::types::order::Deal;
 use binary_options_tools::pocketoption::types::update::DataCandle;
 use binary_options_tools::pocketoption::ws::stream::StreamAsset;
 use binary_options_tools::reimports::FilteredRecieverStream;
+use chrono::Utc;
+use futures_util::future::join_all;
 use futures_util::stream::{BoxStream, Fuse};
 use futures_util::StreamExt;
-use pyo3::{pyclass, pymethods, Bound, IntoPyObjectExt, Py, PyAny, PyResult, Python};
+use pyo3::exceptions::{PyTimeoutError, PyTypeError, PyValueError};
+use pyo3::types::{
+    PyAnyMethods, PyByteArray, PyByteArrayMethods, PyBytes, PyBytesMethods, PyFloat, PyInt,
+    PyString, PyStringMethods,
+};
+use pyo3::{
+    pyclass, pymethods, Bound, FromPyObject, IntoPyObjectExt, Py, PyAny, PyObject, PyResult,
+    Python,
+};
 use pyo3_async_runtimes::tokio::future_into_py;
+use serde::Serialize;
 use url::Url;
 use uuid::Uuid;
 
 use crate::error::BinaryErrorPy;
 use crate::runtime::get_runtime;
-use crate::stream::next_stream;
-use crate::validator::RawValidator;
+use crate::stream::{next_stream, next_stream_batch};
+use crate::validator::{RawValidator, ValidatorArg};
 use crate::config::PyConfig;
 use tokio::sync::Mutex;
+use tracing::debug;
+
+/// Size in bytes of a single candle in the buffer returned by `get_candles_buffer`
+const CANDLE_RECORD_SIZE: usize = 8 * 5;
 
 #[pyclass]
 #[derive(Clone)]
@@ -29,9 +46,35 @@ pub struct RawPocketOption {
     client: PocketOption,
 }
 
+/// Size in bytes of a single record yielded by `subscribe_symbol_close` iterators
+const CLOSE_RECORD_SIZE: usize = 8 * 2;
+
+/// How a `StreamIterator` hands every candle to Python
+#[derive(Clone, Copy)]
+enum CandleFormat {
+    /// JSON encoded `str`
+    Str,
+    /// JSON encoded `bytes`
+    Json,
+    /// `CLOSE_RECORD_SIZE` bytes: the unix timestamp (`i64`) and the close price (`f64`), little endian
+    Close,
+    /// `CANDLE_RECORD_SIZE` bytes, same layout as the records of `get_candles_buffer`
+    Record,
+}
+
+/// Appends the `CANDLE_RECORD_SIZE` bytes record of `candle`: the unix timestamp (`i64`)
+/// followed by the open, high, low and close prices (`f64`), little endian
+fn write_candle_record(buffer: &mut Vec<u8>, candle: &DataCandle) {
+    buffer.extend_from_slice(&candle.time.timestamp().to_le_bytes());
+    for value in [candle.open, candle.high, candle.low, candle.close] {
+        buffer.extend_from_slice(&value.to_le_bytes());
+    }
+}
+
 #[pyclass]
 pub struct StreamIterator {
     stream: Arc<Mutex<Fuse<BoxStream<'static, PocketResult<DataCandle>>>>>,
+    format: CandleFormat,
 }
 
 #[pyclass]
@@ -39,21 +82,141 @@ pub struct RawStreamIterator {
     stream: Arc<Mutex<Fuse<BoxStream<'static, BinaryOptionsResult<RawWebsocketMessage>>>>>,
 }
 
+/// Raw websocket message, accepted from Python as `str`, `bytes` or `bytearray`
+/// so payloads that are already encoded don't need to be decoded to `str` first.
+pub struct RawMessage(pub String);
+
+impl<'py> FromPyObject<'py> for RawMessage {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        if let Ok(text) = ob.downcast::<PyString>() {
+            return Ok(Self(text.to_str()?.to_owned()));
+        }
+        // Websocket text frames must be valid UTF-8, so the bytes are only validated, never decoded
+        let text = if let Ok(raw) = ob.downcast::<PyBytes>() {
+            str::from_utf8(raw.as_bytes()).map(|text| text.to_owned())
+        } else if let Ok(raw) = ob.downcast::<PyByteArray>() {
+            String::from_utf8(raw.to_vec()).map_err(|e| e.utf8_error())
+        } else {
+            return Err(PyTypeError::new_err("message must be str, bytes or bytearray"));
+        };
+        text.map(Self)
+            .map_err(|e| PyValueError::new_err(format!("message is not valid UTF-8, {e}")))
+    }
+}
+
+/// Timeout accepted from Python as seconds (`int` or `float`) or as a `timedelta`
+pub struct Timeout(Duration);
+
+impl<'py> FromPyObject<'py> for Timeout {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        if ob.is_instance_of::<PyFloat>() || ob.is_instance_of::<PyInt>() {
+            let secs = ob.extract::<f64>()?;
+            return Duration::try_from_secs_f64(secs)
+                .map(Self)
+                .map_err(|e| PyValueError::new_err(format!("Invalid timeout of {secs} seconds, {e}")));
+        }
+        ob.extract::<Duration>().map(Self)
+    }
+}
+
+/// Serializes `value` to JSON and hands it to Python as `bytes`, which skips
+/// building a `str` that would only be parsed again on the Python side.
+fn json_bytes<T: Serialize>(py: Python<'_>, value: &T) -> PyResult<PyObject> {
+    let raw = serde_json::to_vec(value).map_err(BinaryErrorPy::from)?;
+    Ok(PyBytes::new(py, &raw).into_any().unbind())
+}
+
+/// Waits for the result of the deal `id`, bounded by the deal expiration plus
+/// `extra_secs` (5 seconds if the expiration is unknown).
+async fn wait_deal_result(client: &PocketOption, id: Uuid, extra_secs: u64) -> PyResult<Deal> {
+    // The wall clock is only read once to turn the expiration into a duration,
+    // the wait itself runs on tokio's monotonic timer
+    let remaining = client
+        .get_deal_end_time(id)
+        .await
+        .and_then(|end| (end - Utc::now()).to_std().ok())
+        .filter(|remaining| !remaining.is_zero())
+        .unwrap_or(Duration::from_secs(5));
+    let timeout = remaining + Duration::from_secs(extra_secs);
+    debug!(target: "CheckResults", "Timeout set to: {timeout:?}");
+    Ok(tokio::time::timeout(timeout, client.check_results(id))
+        .await
+        .map_err(|_| {
+            PyTimeoutError::new_err(format!("Timed out waiting for the result of trade {id}"))
+        })?
+        .map_err(BinaryErrorPy::from)?)
+}
+
+/// Shortest time worth spending on the retry of a raw order
+const MIN_RETRY_BUDGET: Duration = Duration::from_millis(100);
+
+/// Sends a raw order and retries it once if it fails, both attempts share
+/// `timeout` so the whole call never takes longer than it. The first attempt
+/// waits for nearly all of it, so a slow response is never sent twice: only
+/// an attempt that fails early leaves enough time for the retry.
+async fn raw_order_with_retry(
+    client: &PocketOption,
+    message: String,
+    validator: RawValidator,
+    timeout: Duration,
+) -> PocketResult<RawWebsocketMessage> {
+    let deadline = Instant::now() + timeout;
+    let first_timeout = timeout
+        .checked_sub(MIN_RETRY_BUDGET)
+        .filter(|first| !first.is_zero())
+        .unwrap_or(timeout);
+    let first = client
+        .create_raw_order_with_timeout(message.clone(), Box::new(validator.clone()), first_timeout)
+        .await;
+    match first {
+        Ok(res) => Ok(res),
+        Err(e) => {
+            let remaining = deadline.saturating_duration_since(Instant::now());
+            if remaining < MIN_RETRY_BUDGET {
+                return Err(e);
+            }
+            debug!(target: "CreateRawOrderWithRetry", "Failed once ({e}), retrying within {remaining:?}");
+            client
+                .create_raw_order_with_timeout(message, Box::new(validator), remaining)
+                .await
+        }
+    }
+}
+
 #[pymethods]
 impl RawPocketOption {
     #[new]
-    #[pyo3(signature = (ssid, config = None))]
-    pub fn new(ssid: String, config: Option<PyConfig>, py: Python<'_>) -> PyResult<Self> {
+    #[pyo3(signature = (ssid, config = None, url = None))]
+    pub fn new(
+        ssid: String,
+        config: Option<Bound<'_, PyConfig>>,
+        url: Option<String>,
+        py: Python<'_>,
+    ) -> PyResult<Self> {
         let runtime = get_runtime(py)?;
+        // PyConfig is frozen, so it can be read in place instead of being cloned on extraction
+        let builder = config.map(|config| config.get().build()).transpose()?;
+        let url = url
+            .map(|url| Url::parse(&url))
+            .transpose()
+            .map_err(|e| BinaryErrorPy::from(BinaryOptionsToolsError::from(e)))?;
         runtime.block_on(async move {
-            let client = if let Some(config) = config {
-                let builder = config.build()?;
-                let config = builder.build().map_err(BinaryOptionsToolsError::from).map_err(BinaryErrorPy::from)?;
-                PocketOption::new_with_config(ssid, config)
+            let client = match (builder, url) {
+                (Some(builder), url) => {
+                    // An explicit url takes precedence over the ones of the config
+                    let builder = match url {
+                        Some(url) => builder.default_connection_url(HashSet::from([url])),
+                        None => builder,
+                    };
+                    let config = builder.build().map_err(BinaryOptionsToolsError::from).map_err(BinaryErrorPy::from)?;
+                    PocketOption::new_with_config(ssid, config)
+                        .await
+                        .map_err(BinaryErrorPy::from)?
+                }
+                (None, Some(url)) => PocketOption::new_with_url(ssid, url)
                     .await
-                    .map_err(BinaryErrorPy::from)?
-            } else {
-                PocketOption::new(ssid).await.map_err(BinaryErrorPy::from)?
+                    .map_err(BinaryErrorPy::from)?,
+                (None, None) => PocketOption::new(ssid).await.map_err(BinaryErrorPy::from)?,
             };
             Ok(Self { client })
         })
@@ -61,29 +224,10 @@ impl RawPocketOption {
 
     #[staticmethod]
     #[pyo3(signature = (ssid, url, config = None))]
-    pub fn new_with_url(py: Python<'_>, ssid: String, url: String, config: Option<PyConfig>) -> PyResult<Self> {
-        let runtime = get_runtime(py)?;
-        runtime.block_on(async move {
-            let parsed_url = Url::parse(&url)
-                .map_err(|e| BinaryErrorPy::from(BinaryOptionsToolsError::from(e)))?;
-            
-            let client = if let Some(config) = config {
-                let builder = config.build()?;
-                let config = builder.build().map_err(BinaryOptionsToolsError::from).map_err(BinaryErrorPy::from)?;
-                PocketOption::new_with_config(ssid, config)
-                    .await
-                    .map_err(BinaryErrorPy::from)?
-            } else {
-                PocketOption::new_with_url(ssid, parsed_url)
-                    .await
-                    .map_err(BinaryErrorPy::from)?
-            };
-            Ok(Self { client })
-        })
+    pub fn new_with_url(py: Python<'_>, ssid: String, url: String, config: Option<Bound<'_, PyConfig>>) -> PyResult<Self> {
+        Self::new(ssid, config, Some(url), py)
     }
 
-    
-
     pub async fn is_demo(&self) -> bool {
         self.client.is_demo().await
     }
@@ -107,6 +251,24 @@ impl RawPocketOption {
         })
     }
 
+    /// Same as `buy` but the deal is returned as JSON encoded `bytes`
+    pub fn buy_bytes<'py>(
+        &self,
+        py: Python<'py>,
+        asset: String,
+        amount: f64,
+        time: u32,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let res = client
+                .buy(asset, amount, time)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+            Python::with_gil(|py| (res.0.to_string(), json_bytes(py, &res.1)?).into_py_any(py))
+        })
+    }
+
     pub fn sell<'py>(
         &self,
         py: Python<'py>,
@@ -126,6 +288,24 @@ impl RawPocketOption {
         })
     }
 
+    /// Same as `sell` but the deal is returned as JSON encoded `bytes`
+    pub fn sell_bytes<'py>(
+        &self,
+        py: Python<'py>,
+        asset: String,
+        amount: f64,
+        time: u32,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let res = client
+                .sell(asset, amount, time)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+            Python::with_gil(|py| (res.0.to_string(), json_bytes(py, &res.1)?).into_py_any(py))
+        })
+    }
+
     pub fn check_win<'py>(&self, py: Python<'py>, trade_id: String) -> PyResult<Bound<'py, PyAny>> {
         let client = self.client.clone();
         future_into_py(py, async move {
@@ -141,6 +321,81 @@ impl RawPocketOption {
         })
     }
 
+    pub fn check_win_bytes<'py>(&self, py: Python<'py>, trade_id: String) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let res = client
+                .check_results(Uuid::parse_str(&trade_id).map_err(BinaryErrorPy::from)?)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+            Python::with_gil(|py| json_bytes(py, &res))
+        })
+    }
+
+    /// Waits for the deal to be closed and returns its result as JSON `bytes`.
+    /// Resolves as soon as the closing message is received, the wait is bounded by
+    /// the deal expiration plus `extra_secs` (5 seconds if the expiration is unknown).
+    #[pyo3(signature = (trade_id, extra_secs = 5))]
+    pub fn await_deal_result<'py>(
+        &self,
+        py: Python<'py>,
+        trade_id: String,
+        extra_secs: u64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let id = Uuid::parse_str(&trade_id).map_err(BinaryErrorPy::from)?;
+            let res = wait_deal_result(&client, id, extra_secs).await?;
+            Python::with_gil(|py| json_bytes(py, &res))
+        })
+    }
+
+    /// Places a buy trade and waits for its result, returns a tuple of the trade id
+    /// and the closed deal as JSON `bytes`. Same as `buy` followed by `await_deal_result`
+    /// in a single call.
+    #[pyo3(signature = (asset, amount, time, extra_secs = 5))]
+    pub fn buy_and_await_result<'py>(
+        &self,
+        py: Python<'py>,
+        asset: String,
+        amount: f64,
+        time: u32,
+        extra_secs: u64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let (id, _) = client
+                .buy(asset, amount, time)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+            let res = wait_deal_result(&client, id, extra_secs).await?;
+            Python::with_gil(|py| (id.to_string(), json_bytes(py, &res)?).into_py_any(py))
+        })
+    }
+
+    /// Places a sell trade and waits for its result, returns a tuple of the trade id
+    /// and the closed deal as JSON `bytes`. Same as `sell` followed by `await_deal_result`
+    /// in a single call.
+    #[pyo3(signature = (asset, amount, time, extra_secs = 5))]
+    pub fn sell_and_await_result<'py>(
+        &self,
+        py: Python<'py>,
+        asset: String,
+        amount: f64,
+        time: u32,
+        extra_secs: u64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let (id, _) = client
+                .sell(asset, amount, time)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+            let res = wait_deal_result(&client, id, extra_secs).await?;
+            Python::with_gil(|py| (id.to_string(), json_bytes(py, &res)?).into_py_any(py))
+        })
+    }
+
     pub async fn get_deal_end_time(&self, trade_id: String) -> PyResult<Option<i64>> {
         Ok(self
             .client
@@ -170,6 +425,70 @@ impl RawPocketOption {
         })
     }
 
+    pub fn get_candles_bytes<'py>(
+        &self,
+        py: Python<'py>,
+        asset: String,
+        period: i64,
+        offset: i64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let res = client
+                .get_candles(asset, period, offset)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+            Python::with_gil(|py| json_bytes(py, &res))
+        })
+    }
+
+    /// Same as `get_candles` but returns a JSON array of `[time, open, high, low, close]`
+    /// rows (unix timestamp in seconds), dropping the repeated keys of every candle.
+    pub fn get_candles_rows<'py>(
+        &self,
+        py: Python<'py>,
+        asset: String,
+        period: i64,
+        offset: i64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let res = client
+                .get_candles(asset, period, offset)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+            let rows: Vec<_> = res
+                .iter()
+                .map(|c| (c.time.timestamp(), c.open, c.high, c.low, c.close))
+                .collect();
+            Python::with_gil(|py| json_bytes(py, &rows))
+        })
+    }
+
+    /// Same as `get_candles` but returns the candles packed in a `bytes` buffer, every
+    /// candle is `CANDLE_RECORD_SIZE` bytes: the unix timestamp (`i64`) followed by
+    /// open, high, low and close (`f64`), all little endian.
+    pub fn get_candles_buffer<'py>(
+        &self,
+        py: Python<'py>,
+        asset: String,
+        period: i64,
+        offset: i64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let res = client
+                .get_candles(asset, period, offset)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+            let mut buffer = Vec::with_capacity(res.len() * CANDLE_RECORD_SIZE);
+            for candle in res.iter() {
+                write_candle_record(&mut buffer, candle);
+            }
+            Python::with_gil(|py| Ok(PyBytes::new(py, &buffer).into_any().unbind()))
+        })
+    }
+
     pub fn get_candles_advanced<'py>(&self, py: Python<'py>, asset: String, period: i64, offset: i64, time: i64) -> PyResult<Bound<'py, PyAny>> {
         let client = self.client.clone();
 
@@ -191,6 +510,16 @@ impl RawPocketOption {
         Ok(serde_json::to_string(&res).map_err(BinaryErrorPy::from)?)
     }
 
+    pub async fn balance_bytes(&self) -> PyResult<PyObject> {
+        let res = self.client.get_balance().await;
+        Python::with_gil(|py| json_bytes(py, &res))
+    }
+
+    /// Returns only the balance amount, without serializing the rest of the update
+    pub async fn balance_float(&self) -> f64 {
+        self.client.get_balance().await.balance
+    }
+
     pub async fn closed_deals(&self) -> PyResult<String> {
         let res = self.client.get_closed_deals().await;
         Ok(serde_json::to_string(&res).map_err(BinaryErrorPy::from)?)
@@ -250,7 +579,55 @@ impl RawPocketOption {
             // Wrap the BoxStream in an Arc and Mutex
             let stream = Arc::new(Mutex::new(boxed_stream));
 
-            Python::with_gil(|py| StreamIterator { stream }.into_py_any(py))
+            Python::with_gil(|py| StreamIterator { stream, format: CandleFormat::Str }.into_py_any(py))
+        })
+    }
+
+    /// Same as `subscribe_symbol` but the iterator yields JSON encoded `bytes`
+    pub fn subscribe_symbol_bytes<'py>(
+        &self,
+        py: Python<'py>,
+        symbol: String,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let stream_asset = client
+                .subscribe_symbol(symbol)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+
+            let boxed_stream = StreamAsset::to_stream_static(Arc::new(stream_asset))
+                .boxed()
+                .fuse();
+            let stream = Arc::new(Mutex::new(boxed_stream));
+
+            Python::with_gil(|py| StreamIterator { stream, format: CandleFormat::Json }.into_py_any(py))
+        })
+    }
+
+    /// Same as `subscribe_symbol` but the iterator only yields the close price of every
+    /// candle, as a `CLOSE_RECORD_SIZE` bytes record: the unix timestamp (`i64`)
+    /// followed by the close price (`f64`), both little endian.
+    pub fn subscribe_symbol_close<'py>(
+        &self,
+        py: Python<'py>,
+        symbol: String,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let stream_asset = client
+                .subscribe_symbol(symbol)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+
+            let boxed_stream = StreamAsset::to_stream_static(Arc::new(stream_asset))
+                .boxed()
+                .fuse();
+            let stream = Arc::new(Mutex::new(boxed_stream));
+
+            Python::with_gil(|py| {
+                StreamIterator { stream, format: CandleFormat::Close }.into_py_any(py)
+            })
         })
     }
 
@@ -275,7 +652,33 @@ impl RawPocketOption {
             // Wrap the BoxStream in an Arc and Mutex
             let stream = Arc::new(Mutex::new(boxed_stream));
 
-            Python::with_gil(|py| StreamIterator { stream }.into_py_any(py))
+            Python::with_gil(|py| StreamIterator { stream, format: CandleFormat::Str }.into_py_any(py))
+        })
+    }
+
+    /// Same as `subscribe_symbol_chuncked` but every candle is sent as a
+    /// `CANDLE_RECORD_SIZE` bytes record, see `write_candle_record`
+    pub fn subscribe_symbol_chuncked_buffer<'py>(
+        &self,
+        py: Python<'py>,
+        symbol: String,
+        chunck_size: usize,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let stream_asset = client
+                .subscribe_symbol_chuncked(symbol, chunck_size)
+                .await
+                .map_err(BinaryErrorPy::from)?;
+
+            let boxed_stream = StreamAsset::to_stream_static(Arc::new(stream_asset))
+                .boxed()
+                .fuse();
+            let stream = Arc::new(Mutex::new(boxed_stream));
+
+            Python::with_gil(|py| {
+                StreamIterator { stream, format: CandleFormat::Record }.into_py_any(py)
+            })
         })
     }
 
@@ -300,19 +703,19 @@ impl RawPocketOption {
             // Wrap the BoxStream in an Arc and Mutex
             let stream = Arc::new(Mutex::new(boxed_stream));
 
-            Python::with_gil(|py| StreamIterator { stream }.into_py_any(py))
+            Python::with_gil(|py| StreamIterator { stream, format: CandleFormat::Str }.into_py_any(py))
         })
     }
 
     pub fn send_raw_message<'py>(
         &self,
         py: Python<'py>,
-        message: String,
+        message: RawMessage,
     ) -> PyResult<Bound<'py, PyAny>> {
         let client = self.client.clone();
         future_into_py(py, async move {
             client
-                .send_raw_message(message)
+                .send_raw_message(message.0)
                 .await
                 .map_err(BinaryErrorPy::from)?;
             // Clone the stream_asset and convert it to a BoxStream
@@ -320,35 +723,99 @@ impl RawPocketOption {
         })
     }
 
+    /// Queues the message to be sent and returns immediately, raises if the
+    /// sending queue is full.
+    pub fn send_raw_message_nowait(&self, message: RawMessage) -> PyResult<()> {
+        self.client
+            .send_raw_message_nowait(message.0)
+            .map_err(BinaryErrorPy::from)?;
+        Ok(())
+    }
+
     pub fn create_raw_order<'py>(
         &self,
         py: Python<'py>,
-        message: String,
-        validator: Bound<'py, RawValidator>,
+        message: RawMessage,
+        validator: ValidatorArg,
     ) -> PyResult<Bound<'py, PyAny>> {
         let client = self.client.clone();
-        let validator = validator.get().clone();
+        let validator = validator.0;
         future_into_py(py, async move {
             let res = client
-                .create_raw_order(message, Box::new(validator))
+                .create_raw_order(message.0, Box::new(validator))
                 .await
                 .map_err(BinaryErrorPy::from)?;
             Ok(res.to_string())
         })
     }
 
+    /// Blocking `create_raw_order` (`create_raw_order_with_timeout` if `timeout`
+    /// is set) for callers without an event loop, the GIL is released while
+    /// waiting so other Python threads (and custom validators) keep running.
+    #[pyo3(signature = (message, validator, timeout = None))]
+    pub fn create_raw_order_sync(
+        &self,
+        py: Python<'_>,
+        message: RawMessage,
+        validator: ValidatorArg,
+        timeout: Option<Timeout>,
+    ) -> PyResult<String> {
+        let runtime = get_runtime(py)?;
+        let client = self.client.clone();
+        let validator = Box::new(validator.0);
+        let res = py
+            .allow_threads(|| {
+                runtime.block_on(async move {
+                    match timeout {
+                        Some(timeout) => {
+                            client
+                                .create_raw_order_with_timeout(message.0, validator, timeout.0)
+                                .await
+                        }
+                        None => client.create_raw_order(message.0, validator).await,
+                    }
+                })
+            })
+            .map_err(BinaryErrorPy::from)?;
+        Ok(res.to_string())
+    }
+
+    /// Sends every `(message, validator)` pair concurrently and returns one
+    /// `(ok, response_or_error)` tuple per order, in the same order, so a
+    /// failing order doesn't fail the whole batch.
+    pub fn create_raw_orders_batch<'py>(
+        &self,
+        py: Python<'py>,
+        orders: Vec<(RawMessage, ValidatorArg)>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let results = join_all(orders.into_iter().map(|(message, validator)| {
+                let client = client.clone();
+                async move {
+                    match client.create_raw_order(message.0, Box::new(validator.0)).await {
+                        Ok(res) => (true, res.to_string()),
+                        Err(e) => (false, e.to_string()),
+                    }
+                }
+            }))
+            .await;
+            Ok(results)
+        })
+    }
+
     pub fn create_raw_order_with_timeout<'py>(
         &self,
         py: Python<'py>,
-        message: String,
-        validator: Bound<'py, RawValidator>,
-        timeout: Duration,
+        message: RawMessage,
+        validator: ValidatorArg,
+        timeout: Timeout,
     ) -> PyResult<Bound<'py, PyAny>> {
         let client = self.client.clone();
-        let validator = validator.get().clone();
+        let validator = validator.0;
         future_into_py(py, async move {
             let res = client
-                .create_raw_order_with_timeout(message, Box::new(validator), timeout)
+                .create_raw_order_with_timeout(message.0, Box::new(validator), timeout.0)
                 .await
                 .map_err(BinaryErrorPy::from)?;
             Ok(res.to_string())
@@ -358,15 +825,14 @@ impl RawPocketOption {
     pub fn create_raw_order_with_timeout_and_retry<'py>(
         &self,
         py: Python<'py>,
-        message: String,
-        validator: Bound<'py, RawValidator>,
-        timeout: Duration,
+        message: RawMessage,
+        validator: ValidatorArg,
+        timeout: Timeout,
     ) -> PyResult<Bound<'py, PyAny>> {
         let client = self.client.clone();
-        let validator = validator.get().clone();
+        let validator = validator.0;
         future_into_py(py, async move {
-            let res = client
-                .create_raw_order_with_timeout_and_retry(message, Box::new(validator), timeout)
+            let res = raw_order_with_retry(&client, message.0, validator, timeout.0)
                 .await
                 .map_err(BinaryErrorPy::from)?;
             Ok(res.to_string())
@@ -377,15 +843,15 @@ impl RawPocketOption {
     pub fn create_raw_iterator<'py>(
         &self,
         py: Python<'py>,
-        message: String,
-        validator: Bound<'py, RawValidator>,
-        timeout: Option<Duration>,
+        message: RawMessage,
+        validator: ValidatorArg,
+        timeout: Option<Timeout>,
     ) -> PyResult<Bound<'py, PyAny>> {
         let client = self.client.clone();
-        let validator = validator.get().clone();
+        let validator = validator.0;
         future_into_py(py, async move {
             let raw_stream = client
-                .create_raw_iterator(message, Box::new(validator), timeout)
+                .create_raw_iterator(message.0, Box::new(validator), timeout.map(|timeout| timeout.0))
                 .await
                 .map_err(BinaryErrorPy::from)?;
 
@@ -410,6 +876,26 @@ impl RawPocketOption {
     }
 }
 
+impl StreamIterator {
+    fn encode(py: Python<'_>, candle: &DataCandle, format: CandleFormat) -> PyResult<PyObject> {
+        match format {
+            CandleFormat::Str => candle.to_string().into_py_any(py),
+            CandleFormat::Json => json_bytes(py, candle),
+            CandleFormat::Close => {
+                let mut record = [0u8; CLOSE_RECORD_SIZE];
+                record[..8].copy_from_slice(&candle.time.timestamp().to_le_bytes());
+                record[8..].copy_from_slice(&candle.close.to_le_bytes());
+                Ok(PyBytes::new(py, &record).into_any().unbind())
+            }
+            CandleFormat::Record => {
+                let mut record = Vec::with_capacity(CANDLE_RECORD_SIZE);
+                write_candle_record(&mut record, candle);
+                Ok(PyBytes::new(py, &record).into_any().unbind())
+            }
+        }
+    }
+}
+
 #[pymethods]
 impl StreamIterator {
     fn __aiter__(slf: Py<Self>) -> Py<Self> {
@@ -422,20 +908,59 @@ impl StreamIterator {
 
     fn __anext__<'py>(&'py mut self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let stream = self.stream.clone();
+        let format = self.format;
         future_into_py(py, async move {
-            let res = next_stream(stream, false).await;
-            res.map(|res| res.to_string())
+            let res = next_stream(stream, false).await?;
+            Python::with_gil(|py| Self::encode(py, &res, format))
         })
     }
 
-    fn __next__<'py>(&'py self, py: Python<'py>) -> PyResult<String> {
+    fn __next__<'py>(&'py self, py: Python<'py>) -> PyResult<PyObject> {
         let runtime = get_runtime(py)?;
         let stream = self.stream.clone();
-        runtime.block_on(async move {
-            let res = next_stream(stream, true).await;
-            res.map(|res| res.to_string())
+        // The GIL is released while waiting, so the loop thread of the sync client
+        // and any other python thread keep running
+        let res = py.allow_threads(|| runtime.block_on(next_stream(stream, true)))?;
+        Self::encode(py, &res, self.format)
+    }
+
+    /// Awaits the next candle and returns it together with every candle that
+    /// arrives within `max_wait_ms`, up to `max_n` items.
+    #[pyo3(signature = (max_n = 64, max_wait_ms = 5))]
+    fn next_batch<'py>(
+        &self,
+        py: Python<'py>,
+        max_n: usize,
+        max_wait_ms: u64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let stream = self.stream.clone();
+        let format = self.format;
+        future_into_py(py, async move {
+            let res =
+                next_stream_batch(stream, max_n, Duration::from_millis(max_wait_ms), false).await?;
+            Python::with_gil(|py| {
+                res.iter()
+                    .map(|candle| Self::encode(py, candle, format))
+                    .collect::<PyResult<Vec<_>>>()?
+                    .into_py_any(py)
+            })
         })
     }
+
+    /// Blocking `next_batch` for the sync iterators, the GIL is released while
+    /// waiting. With `max_wait_ms = 0` only the candles that already arrived
+    /// are added to the first one.
+    #[pyo3(signature = (max_n = 64, max_wait_ms = 0))]
+    fn next_batch_sync(&self, py: Python<'_>, max_n: usize, max_wait_ms: u64) -> PyResult<Vec<PyObject>> {
+        let runtime = get_runtime(py)?;
+        let stream = self.stream.clone();
+        let res = py.allow_threads(|| {
+            runtime.block_on(next_stream_batch(stream, max_n, Duration::from_millis(max_wait_ms), true))
+        })?;
+        res.iter()
+            .map(|candle| Self::encode(py, candle, self.format))
+            .collect()
+    }
 }
 
 #[pymethods]
@@ -459,10 +984,42 @@ impl RawStreamIterator {
     fn __next__<'py>(&'py self, py: Python<'py>) -> PyResult<String> {
         let runtime = get_runtime(py)?;
         let stream = self.stream.clone();
-        runtime.block_on(async move {
-            let res = next_stream(stream, true).await;
-            res.map(|res| res.to_string())
+        py.allow_threads(|| {
+            runtime.block_on(async move {
+                let res = next_stream(stream, true).await;
+                res.map(|res| res.to_string())
+            })
         })
     }
+
+    /// Awaits the next message and returns it together with every message that
+    /// arrives within `max_wait_ms`, up to `max_n` items.
+    #[pyo3(signature = (max_n = 64, max_wait_ms = 5))]
+    fn next_batch<'py>(
+        &self,
+        py: Python<'py>,
+        max_n: usize,
+        max_wait_ms: u64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let stream = self.stream.clone();
+        future_into_py(py, async move {
+            let res =
+                next_stream_batch(stream, max_n, Duration::from_millis(max_wait_ms), false).await?;
+            Ok(res.iter().map(|msg| msg.to_string()).collect::<Vec<_>>())
+        })
+    }
+
+    /// Blocking `next_batch` for the sync iterators, the GIL is released while
+    /// waiting. With `max_wait_ms = 0` only the messages that already arrived
+    /// are added to the first one.
+    #[pyo3(signature = (max_n = 64, max_wait_ms = 0))]
+    fn next_batch_sync(&self, py: Python<'_>, max_n: usize, max_wait_ms: u64) -> PyResult<Vec<String>> {
+        let runtime = get_runtime(py)?;
+        let stream = self.stream.clone();
+        let res = py.allow_threads(|| {
+            runtime.block_on(next_stream_batch(stream, max_n, Duration::from_millis(max_wait_ms), true))
+        })?;
+        Ok(res.iter().map(|msg| msg.to_string()).collect())
+    }
 }
 
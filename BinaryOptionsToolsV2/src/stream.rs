@@ -1,7 +1,9 @@
 use std::sync::Arc;
+use std::time::Duration;
 
 use futures_util::{
-    stream::{BoxStream, Fuse},
+    future::ready,
+    stream::{empty, once, BoxStream, Fuse},
     StreamExt,
 };
 use pyo3::{
@@ -9,6 +11,7 @@ use pyo3::{
     PyResult,
 };
 use tokio::sync::Mutex;
+use tokio::time::{timeout_at, Instant};
 
 pub type PyStream<T, E> = Fuse<BoxStream<'static, Result<T, E>>>;
 
@@ -34,3 +37,37 @@ where
         },
     }
 }
+
+/// Waits for the next item of the stream and then keeps pulling items that are
+/// ready until `max` items are collected or `wait` has elapsed, so a single call
+/// can hand several messages to Python at once.
+/// An error met after the first item is put back in front of the stream, so the
+/// collected items are delivered and the next call raises it like `next_stream`.
+pub async fn next_stream_batch<T, E>(
+    stream: Arc<Mutex<PyStream<T, E>>>,
+    max: usize,
+    wait: Duration,
+    sync: bool,
+) -> PyResult<Vec<T>>
+where
+    T: Send + 'static,
+    E: std::error::Error + Send + 'static,
+{
+    let first = next_stream(stream.clone(), sync).await?;
+    let mut items = Vec::with_capacity(max.max(1));
+    items.push(first);
+    let mut stream = stream.lock().await;
+    let deadline = Instant::now() + wait;
+    while items.len() < max {
+        match timeout_at(deadline, stream.next()).await {
+            Ok(Some(Ok(item))) => items.push(item),
+            Ok(Some(Err(e))) => {
+                let rest = std::mem::replace(&mut *stream, empty().boxed().fuse());
+                *stream = once(ready(Err(e))).chain(rest).boxed().fuse();
+                break;
+            }
+            Ok(None) | Err(_) => break,
+        }
+    }
+    Ok(items)
+}
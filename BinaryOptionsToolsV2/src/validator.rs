@@ -1,13 +1,16 @@
 use std::sync::Arc;
 
 use pyo3::{
-    pyclass, pymethods,
-    types::{PyAnyMethods, PyList},
-    Bound, PyObject, PyResult, Python,
+    exceptions::PyTypeError,
+    intern, pyclass, pymethods,
+    types::PyAnyMethods,
+    Bound, FromPyObject, PyAny, PyObject, PyResult, Python,
 };
+use memchr::memmem::Finder;
 use regex::Regex;
+use serde_json::Value;
 
-use crate::error::BinaryResultPy;
+use crate::{error::BinaryResultPy, pocketoption::RawMessage};
 use binary_options_tools::{
     pocketoption::types::base::RawWebsocketMessage, reimports::ValidatorTrait,
 };
@@ -26,6 +29,21 @@ pub struct RegexValidator {
     regex: Regex,
 }
 
+/// Substring search with a `memmem` searcher (SIMD accelerated where available),
+/// built once when the validator is created
+#[pyclass]
+#[derive(Clone)]
+pub struct ContainsValidator {
+    finder: Finder<'static>,
+}
+
+#[pyclass]
+#[derive(Clone)]
+pub struct JsonFieldValidator {
+    pointer: String,
+    value: Value,
+}
+
 #[pyclass]
 #[derive(Clone)]
 pub struct PyCustom {
@@ -39,10 +57,11 @@ pub enum RawValidator {
     Regex(RegexValidator),
     StartsWith(String),
     EndsWith(String),
-    Contains(String),
+    Contains(ContainsValidator),
     All(ArrayValidator),
     Any(ArrayValidator),
     Not(BoxedValidator),
+    JsonField(JsonFieldValidator),
     Custom(PyCustom),
 }
 
@@ -52,20 +71,70 @@ impl RawValidator {
         Ok(Self::Regex(RegexValidator { regex }))
     }
 
-    pub fn new_all(validators: Vec<RawValidator>) -> Self {
+    /// Children are checked cheapest first, the order is a performance hint and
+    /// custom validators shouldn't rely on being called
+    pub fn new_all(mut validators: Vec<RawValidator>) -> Self {
+        validators.sort_by_key(Self::cost);
         Self::All(ArrayValidator(validators))
     }
 
-    pub fn new_any(validators: Vec<RawValidator>) -> Self {
+    /// Same ordering as `new_all`, the regexes of the group are also matched as a single
+    /// alternation, so the message is scanned once instead of once per pattern
+    pub fn new_any(mut validators: Vec<RawValidator>) -> Self {
+        let regexes = validators
+            .iter()
+            .filter(|validator| matches!(validator, Self::Regex(_)))
+            .count();
+        if regexes > 1 {
+            let fused = Self::fuse_regexes(validators.iter().filter_map(|validator| {
+                match validator {
+                    Self::Regex(val) => Some(val),
+                    _ => None,
+                }
+            }));
+            if let Some(regex) = fused {
+                validators.retain(|validator| !matches!(validator, Self::Regex(_)));
+                if validators.is_empty() {
+                    return Self::Regex(RegexValidator { regex });
+                }
+                validators.push(Self::Regex(RegexValidator { regex }));
+            }
+        }
+        validators.sort_by_key(Self::cost);
         Self::Any(ArrayValidator(validators))
     }
 
+    /// Builds `(?:a)|(?:b)|...` out of the patterns, `None` if the combined regex can't be compiled
+    fn fuse_regexes<'a>(regexes: impl Iterator<Item = &'a RegexValidator>) -> Option<Regex> {
+        let patterns = regexes
+            .map(|val| format!("(?:{})", val.regex.as_str()))
+            .collect::<Vec<_>>();
+        Regex::new(&patterns.join("|")).ok()
+    }
+
+    /// Rough relative cost of a check: prefix/suffix compare < memmem < regex < JSON parse < Python call
+    fn cost(&self) -> u32 {
+        match self {
+            Self::None() => 0,
+            Self::StartsWith(_) | Self::EndsWith(_) => 1,
+            Self::Contains(_) => 2,
+            Self::Regex(_) => 4,
+            Self::JsonField(_) => 8,
+            Self::Custom(_) => 64,
+            Self::Not(val) => val.0.cost(),
+            Self::All(val) | Self::Any(val) => {
+                val.0.iter().map(Self::cost).fold(0, u32::saturating_add)
+            }
+        }
+    }
+
     pub fn new_not(validator: RawValidator) -> Self {
         Self::Not(BoxedValidator(Box::new(validator)))
     }
 
     pub fn new_contains(pattern: String) -> Self {
-        Self::Contains(pattern)
+        let finder = Finder::new(pattern.as_bytes()).into_owned();
+        Self::Contains(ContainsValidator { finder })
     }
 
     pub fn new_starts_with(pattern: String) -> Self {
@@ -75,6 +144,42 @@ impl RawValidator {
     pub fn new_ends_with(pattern: String) -> Self {
         Self::EndsWith(pattern)
     }
+
+    pub fn new_json_field(pointer: String, value: String) -> BinaryResultPy<Self> {
+        let value = serde_json::from_str(&value)?;
+        Ok(Self::JsonField(JsonFieldValidator { pointer, value }))
+    }
+}
+
+/// Validator argument of the client functions, accepts a `RawValidator` or the
+/// Python `Validator` wrapper, whose `RawValidator` is read from its `_validator`
+/// slot here instead of being unwrapped on the Python side.
+pub struct ValidatorArg(pub RawValidator);
+
+impl<'py> FromPyObject<'py> for ValidatorArg {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        if let Ok(raw) = ob.downcast::<RawValidator>() {
+            return Ok(Self(raw.get().clone()));
+        }
+        let raw = ob
+            .getattr(intern!(ob.py(), "_validator"))
+            .map_err(|_| PyTypeError::new_err("validator must be a Validator or a RawValidator"))?;
+        Ok(Self(raw.downcast::<RawValidator>()?.get().clone()))
+    }
+}
+
+/// Unwraps every item of a python iterable with `ValidatorArg`, without building
+/// an intermediate python list
+fn collect_validators(validators: &Bound<'_, PyAny>) -> PyResult<Vec<RawValidator>> {
+    validators
+        .try_iter()?
+        .map(|item| Ok(item?.extract::<ValidatorArg>()?.0))
+        .collect()
+}
+
+/// Borrows the text of the message, the validators never need their own copy
+fn message_str(message: &RawWebsocketMessage) -> &str {
+    message.as_ref()
 }
 
 impl Default for RawValidator {
@@ -87,13 +192,14 @@ impl ValidatorTrait<RawWebsocketMessage> for RawValidator {
     fn validate(&self, message: &RawWebsocketMessage) -> bool {
         match self {
             Self::None() => true,
-            Self::Contains(pat) => message.to_string().contains(pat),
-            Self::StartsWith(pat) => message.to_string().starts_with(pat),
-            Self::EndsWith(pat) => message.to_string().ends_with(pat),
+            Self::Contains(val) => val.finder.find(message_str(message).as_bytes()).is_some(),
+            Self::StartsWith(pat) => message_str(message).starts_with(pat.as_str()),
+            Self::EndsWith(pat) => message_str(message).ends_with(pat.as_str()),
             Self::Not(val) => !val.validate(message),
             Self::All(val) => val.validate_all(message),
             Self::Any(val) => val.validate_any(message),
             Self::Regex(val) => val.validate(message),
+            Self::JsonField(val) => val.validate(message),
             Self::Custom(val) => val.validate(message),
         }
     }
@@ -104,7 +210,7 @@ impl ValidatorTrait<RawWebsocketMessage> for PyCustom {
         Python::with_gil(|py| {
             let res = self
                 .custom
-                .call(py, (message.to_string(),), None)
+                .call(py, (message_str(message),), None)
                 .expect("Expected provided function to be callable");
             res.extract(py)
                 .expect("Expected provided function to return a boolean")
@@ -128,9 +234,28 @@ impl ValidatorTrait<RawWebsocketMessage> for BoxedValidator {
     }
 }
 
+/// Strips the Socket.IO packet prefix (`^\d+-?`): the packet type like the `42` of
+/// `42["event", ...]`, and the attachment count of binary events like `451-["event", ...]`
+fn socketio_payload(message: &str) -> &str {
+    let payload = message.trim_start_matches(|c: char| c.is_ascii_digit());
+    if payload.len() == message.len() {
+        return payload;
+    }
+    payload.strip_prefix('-').unwrap_or(payload)
+}
+
+impl ValidatorTrait<RawWebsocketMessage> for JsonFieldValidator {
+    fn validate(&self, message: &RawWebsocketMessage) -> bool {
+        serde_json::from_str::<Value>(socketio_payload(message_str(message)))
+            .ok()
+            .and_then(|data| data.pointer(&self.pointer).map(|field| field == &self.value))
+            .unwrap_or(false)
+    }
+}
+
 impl ValidatorTrait<RawWebsocketMessage> for RegexValidator {
     fn validate(&self, message: &RawWebsocketMessage) -> bool {
-        self.regex.is_match(&message.to_string())
+        self.regex.is_match(message_str(message))
     }
 }
 
@@ -161,22 +286,27 @@ impl RawValidator {
         Self::new_ends_with(pattern)
     }
 
+    #[staticmethod]
+    pub fn json_field(pointer: String, value: String) -> PyResult<Self> {
+        Ok(Self::new_json_field(pointer, value)?)
+    }
+
     #[staticmethod]
     pub fn ne(validator: Bound<'_, RawValidator>) -> Self {
         let val = validator.get();
         Self::new_not(val.clone())
     }
 
+    /// Accepts any iterable of `RawValidator` or python `Validator` objects
     #[staticmethod]
-    pub fn all(validator: Bound<'_, PyList>) -> PyResult<Self> {
-        let val = validator.extract::<Vec<RawValidator>>()?;
-        Ok(Self::new_all(val))
+    pub fn all(validator: Bound<'_, PyAny>) -> PyResult<Self> {
+        Ok(Self::new_all(collect_validators(&validator)?))
     }
 
+    /// Accepts any iterable of `RawValidator` or python `Validator` objects
     #[staticmethod]
-    pub fn any(validator: Bound<'_, PyList>) -> PyResult<Self> {
-        let val = validator.extract::<Vec<RawValidator>>()?;
-        Ok(Self::new_any(val))
+    pub fn any(validator: Bound<'_, PyAny>) -> PyResult<Self> {
+        Ok(Self::new_any(collect_validators(&validator)?))
     }
 
     #[staticmethod]
@@ -186,8 +316,131 @@ impl RawValidator {
         })
     }
 
-    pub fn check(&self, msg: String) -> bool {
-        let raw = RawWebsocketMessage::from(msg);
-        self.validate(&raw)
+    /// Accepts `str`, `bytes` or `bytearray`, see `RawMessage`.
+    /// The GIL is released while checking so other threads can validate at the same time.
+    /// Positional only, the fastcall path doesn't have to match keyword names
+    #[pyo3(signature = (msg, /))]
+    pub fn check(&self, py: Python<'_>, msg: RawMessage) -> bool {
+        let raw = RawWebsocketMessage::from(msg.0);
+        py.allow_threads(|| self.validate(&raw))
+    }
+
+    /// Checks every message in a single call, the GIL is released while they
+    /// are checked (custom validators take it back for every message)
+    #[pyo3(signature = (msgs, /))]
+    pub fn check_many(&self, py: Python<'_>, msgs: Vec<RawMessage>) -> Vec<bool> {
+        py.allow_threads(|| {
+            msgs.into_iter()
+                .map(|msg| self.validate(&RawWebsocketMessage::from(msg.0)))
+                .collect()
+        })
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn check(validator: &RawValidator, message: &str) -> bool {
+        validator.validate(&RawWebsocketMessage::from(message))
+    }
+
+    #[test]
+    fn test_json_field_socketio_prefix() {
+        let validator =
+            RawValidator::new_json_field("/1/requestId".to_string(), "\"abc\"".to_string())
+                .unwrap();
+        assert!(check(&validator, r#"42["successopenOrder",{"requestId":"abc"}]"#));
+        assert!(check(&validator, r#"451-["successopenOrder",{"requestId":"abc"}]"#));
+        assert!(!check(&validator, r#"451-["successopenOrder",{"requestId":"xyz"}]"#));
+
+        let validator = RawValidator::new_json_field("/id".to_string(), "-5".to_string()).unwrap();
+        assert!(check(&validator, r#"{"id":-5}"#));
+        assert!(!check(&validator, r#"{"id":5}"#));
+    }
+
+    const MESSAGES: [&str; 6] = [
+        r#"42["successopenOrder",{"requestId":"abc"}]"#,
+        r#"451-["updateStream",[["EURUSD_otc",1700000000,1.1]]]"#,
+        r#"42["failopenOrder","error"]"#,
+        "2",
+        "hello world",
+        "",
+    ];
+
+    fn regex(pattern: &str) -> RawValidator {
+        RawValidator::new_regex(pattern.to_string()).unwrap()
+    }
+
+    fn mixed() -> Vec<RawValidator> {
+        vec![
+            regex(r#"requestId":"\w+""#),
+            RawValidator::new_json_field("/0".to_string(), "\"failopenOrder\"".to_string())
+                .unwrap(),
+            RawValidator::new_not(RawValidator::new_contains("world".to_string())),
+            regex(r"^\d+$"),
+            RawValidator::new_ends_with("]".to_string()),
+            RawValidator::new_starts_with("42".to_string()),
+        ]
+    }
+
+    #[test]
+    fn test_any_fused_regexes() {
+        let regexes = vec![regex(r"^42\["), regex(r"updateStream"), regex(r"^\d+$")];
+        let fused = RawValidator::new_any(regexes.clone());
+        assert!(matches!(fused, RawValidator::Regex(_)));
+        let unfused = RawValidator::Any(ArrayValidator(regexes));
+        for message in MESSAGES {
+            assert_eq!(check(&fused, message), check(&unfused, message), "{message}");
+        }
+
+        // The regexes of a mixed group are fused into a single child
+        let any = RawValidator::new_any(mixed());
+        match &any {
+            RawValidator::Any(val) => assert_eq!(
+                val.0.iter().filter(|v| matches!(v, RawValidator::Regex(_))).count(),
+                1
+            ),
+            _ => panic!("expected an Any validator"),
+        }
+    }
+
+    #[test]
+    fn test_any_fuse_fallback() {
+        // Each pattern compiles on its own but the alternation repeats the group name
+        let regexes = vec![
+            regex(r"(?P<event>successopenOrder)"),
+            regex(r"(?P<event>failopenOrder)"),
+        ];
+        let any = RawValidator::new_any(regexes);
+        match &any {
+            RawValidator::Any(val) => assert_eq!(val.0.len(), 2),
+            _ => panic!("expected the regexes to be kept apart"),
+        }
+        assert!(check(&any, MESSAGES[0]));
+        assert!(check(&any, MESSAGES[2]));
+        assert!(!check(&any, MESSAGES[1]));
+    }
+
+    #[test]
+    fn test_sorted_groups_truth_table() {
+        let validators = mixed();
+        let all = RawValidator::new_all(validators.clone());
+        let any = RawValidator::new_any(validators.clone());
+        for message in MESSAGES {
+            let raw = RawWebsocketMessage::from(message);
+            let expected_all = validators.iter().all(|v| v.validate(&raw));
+            let expected_any = validators.iter().any(|v| v.validate(&raw));
+            assert_eq!(all.validate(&raw), expected_all, "{message}");
+            assert_eq!(any.validate(&raw), expected_any, "{message}");
+        }
+
+        match &all {
+            RawValidator::All(val) => {
+                let costs = val.0.iter().map(RawValidator::cost).collect::<Vec<_>>();
+                assert!(costs.windows(2).all(|pair| pair[0] <= pair[1]), "{costs:?}");
+            }
+            _ => panic!("expected an All validator"),
+        }
     }
 }
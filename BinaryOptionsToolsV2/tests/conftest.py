@@ -0,0 +1,27 @@
+import pytest
+
+from BinaryOptionsToolsV2.pocketoption import asyncronous
+from BinaryOptionsToolsV2.pocketoption.asyncronous import PocketOptionAsync
+
+# Manual scripts that need a real ssid, run them directly with python
+collect_ignore = ["test.py", "test_sync.py"]
+
+
+class OfflineClient:
+    """Stands in for `RawPocketOption`, the tests set the client functions they need"""
+
+    def __init__(self, ssid, config=None, url=None):
+        self.ssid = ssid
+        self.config = config
+        self.url = url
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    """Builds `PocketOptionAsync` clients that never connect"""
+    monkeypatch.setattr(asyncronous, "RawPocketOption", OfflineClient)
+
+    def make(**kwargs) -> PocketOptionAsync:
+        return PocketOptionAsync("offline", **kwargs)
+
+    return make
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from BinaryOptionsToolsV2.pocketoption.asyncronous import _deadline, _RawOrderBatcher, _select_payout
+
+PAYOUT = {"EURUSD_otc": 92, "AUDCAD_otc": 85}
+
+
+def test_select_payout():
+    assert _select_payout(PAYOUT, "EURUSD_otc") == 92
+    assert _select_payout(PAYOUT, "missing") is None
+    assert _select_payout(PAYOUT, ["AUDCAD_otc", "missing"]) == [85, None]
+    assert _select_payout(PAYOUT, {"EURUSD_otc"}) == {"EURUSD_otc": 92}
+    table = _select_payout(PAYOUT, None)
+    assert table == PAYOUT
+    table["EURUSD_otc"] = 0
+    assert PAYOUT["EURUSD_otc"] == 92
+
+
+def test_deadline():
+    async def run():
+        async with _deadline(1):
+            await asyncio.sleep(0)
+        async with _deadline(None):
+            await asyncio.sleep(0.01)
+        # Two different classes before python 3.11
+        with pytest.raises((TimeoutError, asyncio.TimeoutError)):
+            async with _deadline(0.01):
+                await asyncio.sleep(1)
+        # A cancellation from outside isn't turned into a timeout
+        task = asyncio.current_task()
+        asyncio.get_running_loop().call_later(0.01, task.cancel)
+        with pytest.raises(asyncio.CancelledError):
+            async with _deadline(1):
+                await asyncio.sleep(1)
+
+    asyncio.run(run())
+
+
+class BatchClient:
+    def __init__(self, fail: Exception | None = None):
+        self.batches = []
+        self.fail = fail
+
+    async def create_raw_orders_batch(self, orders):
+        self.batches.append([message for message, _ in orders])
+        if self.fail is not None:
+            raise self.fail
+        return [(not message.startswith("bad"), f"response {message}") for message, _ in orders]
+
+
+def test_batcher_fans_out_results():
+    client = BatchClient()
+
+    async def run():
+        batcher = _RawOrderBatcher(client, max_batch=3)
+        results = await asyncio.gather(
+            *(batcher.submit(message, None) for message in ("a", "b", "bad", "c")),
+            return_exceptions=True,
+        )
+        return results
+
+    results = asyncio.run(run())
+    # The 4th order was submitted after the batch got full
+    assert client.batches == [["a", "b", "bad"], ["c"]]
+    assert results[:2] == ["response a", "response b"]
+    assert isinstance(results[2], ValueError)
+    assert results[3] == "response c"
+
+
+def test_batcher_propagates_errors():
+    client = BatchClient(ConnectionError("closed"))
+
+    async def run():
+        batcher = _RawOrderBatcher(client)
+        return await asyncio.gather(batcher.submit("a", None), batcher.submit("b", None), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert client.batches == [["a", "b"]]
+    assert all(isinstance(result, ConnectionError) for result in results)
@@ -0,0 +1,64 @@
+import pytest
+
+from BinaryOptionsToolsV2.config import Config
+from BinaryOptionsToolsV2.pocketoption.asyncronous import _config_from_json
+
+
+def _custom() -> Config:
+    return Config(
+        timeout_secs=10,
+        urls=["wss://example.com/socket.io/?EIO=4&transport=websocket"],
+        extra_duration=7,
+        read_buffer_size=4096,
+        payout_ttl=3.0,
+        breaker_threshold=2,
+        breaker_recovery_secs=1.5,
+    )
+
+
+def test_round_trip():
+    config = _custom()
+    assert Config.from_dict(config.to_dict()) == config
+    assert Config.from_json(config.to_json()) == config
+    assert Config.from_json(config.to_json()) != Config()
+
+
+def test_positional_order():
+    config = Config(100, 100, 5, 30, 30, [], 10)
+    assert config.extra_duration == 10
+    assert config.read_buffer_size == 16384
+    with pytest.raises(TypeError):
+        Config(100, 100, 5, 30, 30, [], 10, 4096)
+
+
+def test_pyconfig_cache_key():
+    assert Config().pyconfig is Config().pyconfig
+    assert _custom().pyconfig is _custom().pyconfig
+    # The Python only fields don't reach PyConfig
+    assert Config(payout_ttl=5.0).pyconfig is Config().pyconfig
+    assert Config(timeout_secs=10).pyconfig is not Config().pyconfig
+    assert _custom().pyconfig.read_buffer_size == 4096
+
+
+def test_locked_after_use():
+    config = Config()
+    config.update({"timeout_secs": 10})
+    config.pyconfig
+    with pytest.raises(RuntimeError):
+        config.update({"timeout_secs": 20})
+
+
+def test_deprecated_init_timeout():
+    with pytest.warns(DeprecationWarning):
+        Config(connection_initialization_timeout_secs=5)
+    with pytest.warns(DeprecationWarning):
+        Config().update({"connection_initialization_timeout_secs": 5})
+
+
+def test_json_configs_are_not_shared():
+    first = _config_from_json('{"payout_ttl": 2.0, "urls": ["wss://example.com"]}')
+    second = _config_from_json('{"payout_ttl": 2.0, "urls": ["wss://example.com"]}')
+    assert first is not second
+    first.payout_ttl = 0
+    assert second.payout_ttl == 2.0
+    assert second.urls == ("wss://example.com",)
@@ -0,0 +1,141 @@
+import asyncio
+import random
+import time
+
+import pytest
+
+from BinaryOptionsToolsV2.pocketoption import asyncronous
+from BinaryOptionsToolsV2.pocketoption.asyncronous import CircuitOpenError, _breaker_key, _CircuitBreaker
+from BinaryOptionsToolsV2.retry import RetryPolicy
+from BinaryOptionsToolsV2.validator import Validator
+
+VALIDATOR = Validator.starts_with("451-")
+
+
+def test_retry_delay_bounds():
+    random.seed(0)
+    policy = RetryPolicy(base=0.1, cap=1.0)
+    for attempt in range(10):
+        for _ in range(50):
+            assert 0 <= policy.delay(attempt) <= min(1.0, 0.1 * 2 ** attempt)
+
+
+def test_retry_policy_retries_until_success(make_client):
+    client = make_client()
+    calls = []
+
+    async def create_raw_order(message, validator):
+        calls.append(message)
+        if len(calls) < 3:
+            raise ValueError("failed")
+        return "451-ok"
+
+    client.client.create_raw_order = create_raw_order
+    policy = RetryPolicy(base=0.001, cap=0.001)
+    result = asyncio.run(client.create_raw_order_with_timeout_and_retry("42[]", VALIDATOR, 5, policy))
+    assert result == "451-ok"
+    assert len(calls) == 3
+
+
+def test_retry_policy_shares_the_deadline(make_client):
+    client = make_client()
+
+    async def create_raw_order(message, validator):
+        await asyncio.sleep(10)
+
+    client.client.create_raw_order = create_raw_order
+    policy = RetryPolicy(base=0.01, cap=0.01, max_attempts=100)
+    start = time.monotonic()
+    # Two different classes before python 3.11
+    with pytest.raises((TimeoutError, asyncio.TimeoutError)):
+        asyncio.run(client.create_raw_order_with_timeout_and_retry("42[]", VALIDATOR, 0.3, policy))
+    assert time.monotonic() - start < 1
+
+
+def test_retry_policy_skips_other_errors(make_client):
+    client = make_client()
+    calls = []
+
+    async def create_raw_order(message, validator):
+        calls.append(message)
+        raise TypeError("not retryable")
+
+    client.client.create_raw_order = create_raw_order
+    with pytest.raises(TypeError):
+        asyncio.run(client.create_raw_order_with_timeout_and_retry("42[]", VALIDATOR, 5, RetryPolicy()))
+    assert len(calls) == 1
+
+
+def test_breaker_transitions():
+    breaker = _CircuitBreaker(2, 0.05)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    # Open
+    assert not breaker.allow()
+    time.sleep(0.06)
+    # Half open, a single trial call goes through
+    assert breaker.allow()
+    assert not breaker.allow()
+    # The trial call failed, open for another window
+    breaker.record_failure()
+    assert not breaker.allow()
+
+
+def test_breaker_key():
+    assert _breaker_key("42[\"openOrder\"]") == _breaker_key(b"42[\"openOrder\"]")
+    assert _breaker_key(bytearray(b"42[\"openOrder\"]")) == _breaker_key("42[\"openOrder\"]")
+    assert len(_breaker_key("é" * 40)) == 32
+
+
+def _failing_client(make_client, exc):
+    client = make_client(config={"breaker_threshold": 2, "breaker_recovery_secs": 0.05})
+    calls = []
+
+    async def create_raw_order_with_timeout(message, validator, timeout):
+        calls.append(message)
+        raise exc
+
+    client.client.create_raw_order_with_timeout = create_raw_order_with_timeout
+    return client, calls
+
+
+@pytest.mark.parametrize("exc", [ValueError("failed"), TimeoutError(), asyncio.TimeoutError()])
+def test_breaker_opens_and_closes(make_client, exc):
+    client, calls = _failing_client(make_client, exc)
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(type(exc)):
+                await client.create_raw_order_with_timout("42a", VALIDATOR, 1)
+        # Open, neither the str nor the bytes message is sent
+        with pytest.raises(CircuitOpenError):
+            await client.create_raw_order_with_timout("42a", VALIDATOR, 1)
+        with pytest.raises(CircuitOpenError):
+            await client.create_raw_order_with_timout(bytearray(b"42a"), VALIDATOR, 1)
+        assert len(calls) == 2
+        await asyncio.sleep(0.06)
+        # The trial call succeeds, the breaker is closed and dropped
+        client.client.create_raw_order_with_timeout = _respond
+        assert await client.create_raw_order_with_timout("42a", VALIDATOR, 1) == "451-ok"
+        assert not client._breakers
+
+    asyncio.run(run())
+
+
+async def _respond(message, validator, timeout):
+    return "451-ok"
+
+
+def test_breakers_are_bounded(make_client, monkeypatch):
+    monkeypatch.setattr(asyncronous, "_MAX_BREAKERS", 4)
+    client, _ = _failing_client(make_client, ValueError("failed"))
+
+    async def run():
+        for i in range(10):
+            with pytest.raises(ValueError):
+                await client.create_raw_order_with_timout(f"42[{i}]", VALIDATOR, 1)
+
+    asyncio.run(run())
+    assert list(client._breakers) == [f"42[{i}]".encode() for i in range(6, 10)]
@@ -0,0 +1,60 @@
+import pytest
+
+from BinaryOptionsToolsV2.validator import Validator
+
+MESSAGES = [
+    '42["successopenOrder",{"requestId":"abc"}]',
+    '451-["updateStream",[["EURUSD_otc",1700000000,1.1]]]',
+    '42["failopenOrder","error"]',
+    "hello world",
+    "",
+]
+
+
+def test_factories_are_cached():
+    assert Validator.starts_with("451-") is Validator.starts_with("451-")
+    assert Validator.regex(r"^\d+") is Validator.regex(r"^\d+")
+    assert Validator.json_field("/0", "x") is Validator.json_field("/0", "x")
+    assert Validator.contains("a") is not Validator.contains("b")
+
+
+def test_combinations_are_cached():
+    parts = [Validator.starts_with("42"), Validator.contains("open")]
+    assert Validator.all(parts) is Validator.all(iter(parts))
+    assert Validator.any(parts) is not Validator.all(parts)
+    assert Validator.ne(parts[0]) is Validator.ne(parts[0])
+
+
+def test_from_spec():
+    assert Validator.from_spec("starts_with", "451-") is Validator.starts_with("451-")
+    assert Validator.from_spec("json_field", "/0", "x") is Validator.json_field("/0", "x")
+    with pytest.raises(ValueError):
+        Validator.from_spec("custom", print)
+
+
+def test_expr_matches_the_combinators():
+    expr = Validator.expr('starts_with("42") and (contains("success") or not ends_with("]"))')
+    combined = Validator.all([
+        Validator.starts_with("42"),
+        Validator.any([Validator.contains("success"), Validator.ne(Validator.ends_with("]"))]),
+    ])
+    for message in MESSAGES:
+        assert expr.check(message) == combined.check(message), message
+    assert Validator.expr('contains("a")') is Validator.expr('contains("a")')
+
+
+@pytest.mark.parametrize("expression", [
+    'print("x")',
+    'contains(name)',
+    'contains("a") + 1',
+    'contains(x="a")',
+])
+def test_expr_rejects_other_code(expression):
+    with pytest.raises(ValueError):
+        Validator.expr(expression)
+
+
+def test_check_many():
+    validator = Validator.starts_with("42")
+    assert validator.check_many(MESSAGES) == [validator.check(message) for message in MESSAGES]
+    assert validator.check(b'42["event"]')
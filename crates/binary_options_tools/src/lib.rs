@@ -3,7 +3,7 @@ pub mod reimports;
 
 pub mod stream {
     pub use binary_options_tools_core::general::stream::RecieverStream;
-    pub use binary_options_tools_core::utils::tracing::stream_logs_layer;
+    pub use binary_options_tools_core::utils::tracing::{stream_logs_layer, stream_logs_layer_values};
 }
 
 pub mod error {
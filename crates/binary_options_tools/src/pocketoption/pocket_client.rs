@@ -682,6 +682,24 @@ impl PocketOption {
         Ok(())
     }
 
+    /// Queues a raw WebSocket message without waiting for it to be sent.
+    ///
+    /// # Arguments
+    /// * `message` - Raw message to send
+    ///
+    /// # Returns
+    /// Returns an error if the sending queue is full instead of waiting for space
+    ///
+    /// # Examples
+    /// ```rust
+    /// client.send_raw_message_nowait(r#"42["ps"]"#)?;
+    /// ```
+    pub fn send_raw_message_nowait(&self, message: impl ToString) -> PocketResult<()> {
+        self.client
+            .try_raw_send(RawWebsocketMessage::from(message.to_string()))?;
+        Ok(())
+    }
+
     /// Sends a raw WebSocket message and waits for a validated response.
     ///
     /// # Arguments
@@ -54,6 +54,12 @@ impl From<String> for RawWebsocketMessage {
     }
 }
 
+impl AsRef<str> for RawWebsocketMessage {
+    fn as_ref(&self) -> &str {
+        &self.value
+    }
+}
+
 impl From<&str> for RawWebsocketMessage {
     fn from(value: &str) -> Self {
         Self { value: value.to_string() }
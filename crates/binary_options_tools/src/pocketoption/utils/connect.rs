@@ -1,8 +1,8 @@
 use binary_options_tools_core::{
     error::BinaryOptionsToolsError,
     reimports::{
-        Connector, MaybeTlsStream, Request, WebSocketStream, connect_async_tls_with_config,
-        generate_key,
+        Connector, MaybeTlsStream, Request, WebSocketConfig, WebSocketStream,
+        connect_async_tls_with_config, generate_key,
     },
 };
 use tokio::net::TcpStream;
@@ -16,6 +16,7 @@ use crate::pocketoption::{
 pub async fn try_connect(
     ssid: Ssid,
     url: String,
+    read_buffer_size: Option<usize>,
 ) -> PocketResult<WebSocketStream<MaybeTlsStream<TcpStream>>> {
     let tls_connector = native_tls::TlsConnector::builder().build()?;
 
@@ -42,7 +43,12 @@ pub async fn try_connect(
         .body(())
         .map_err(BinaryOptionsToolsError::from)?;
 
-    let (ws, _) = connect_async_tls_with_config(request, None, false, Some(connector))
+    let ws_config = read_buffer_size.map(|size| {
+        let mut ws_config = WebSocketConfig::default();
+        ws_config.read_buffer_size = size;
+        ws_config
+    });
+    let (ws, _) = connect_async_tls_with_config(request, ws_config, false, Some(connector))
         .await
         .map_err(BinaryOptionsToolsError::from)?;
     Ok(ws)
@@ -34,10 +34,11 @@ impl Connect for PocketConnect {
         async fn send_ws(
             creds: Ssid,
             url: String,
+            read_buffer_size: Option<usize>,
             sender: Sender<(WebSocketStream<MaybeTlsStream<TcpStream>>, String)>,
         ) -> BinaryOptionsResult<()> {
             info!(target: "TryConnect", "Trying to connecto to {}", url);
-            if let Ok(connect) = try_connect(creds, url.clone()).await {
+            if let Ok(connect) = try_connect(creds, url.clone(), read_buffer_size).await {
                 info!(target: "SuccessConnect", "Succesfully connected to {}", url);
                 sender.send((connect, url.clone())).await.map_err(|e| {
                     BinaryOptionsToolsError::GeneralMessageSendingError(e.to_string())
@@ -49,10 +50,16 @@ impl Connect for PocketConnect {
             ))
         }
         let (sender, reciever) = bounded(1); // It should stop after recieving only one message
+        let read_buffer_size = config.get_read_buffer_size()?;
         let default_urls = config.get_default_connection_url()?;
-        let default_connections = default_urls
-            .iter()
-            .map(|url| tokio::spawn(send_ws(creds.clone(), url.to_string(), sender.clone())));
+        let default_connections = default_urls.iter().map(|url| {
+            tokio::spawn(send_ws(
+                creds.clone(),
+                url.to_string(),
+                read_buffer_size,
+                sender.clone(),
+            ))
+        });
         tokio::select! {
             res = reciever.recv() => return Ok(res.map(|(r, _)| r)?),
             _ = join_all(default_connections) => {}
@@ -60,7 +67,14 @@ impl Connect for PocketConnect {
         let urls = creds.servers().await?;
         let connections = urls
             .iter()
-            .map(|url| tokio::spawn(send_ws(creds.clone(), url.to_owned(), sender.clone())));
+            .map(|url| {
+                tokio::spawn(send_ws(
+                    creds.clone(),
+                    url.to_owned(),
+                    read_buffer_size,
+                    sender.clone(),
+                ))
+            });
         tokio::select! {
             res = reciever.recv() => match res {
                 Ok((res, url)) => {
@@ -435,6 +435,10 @@ where
         self.sender.raw_send::<Transfer>(msg).await
     }
 
+    pub fn try_raw_send(&self, msg: Transfer::Raw) -> BinaryOptionsResult<()> {
+        self.sender.try_raw_send::<Transfer>(msg)
+    }
+
     pub async fn send_message(
         &self,
         msg: Transfer,
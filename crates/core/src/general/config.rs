@@ -23,6 +23,10 @@ pub struct _Config<T: DataHandler, Transfer: MessageTransfer, U: InnerConfig> {
     pub callbacks: Vec<Callback<T, Transfer, U>>,
     pub connection_initialization_timeout: Duration,
     pub timeout: Duration, // General timeout
+    /// Size of the websocket read buffer, uses the `tungstenite` default when `None`
+    #[serde(default)]
+    #[config(extra(optional))]
+    pub read_buffer_size: Option<usize>,
     #[serde(bound = "U: Serialize + for<'d> Deserialize<'d>")]
     pub extra: U,
     // #[serde(skip)]
@@ -39,6 +43,7 @@ impl<T: DataHandler, Transfer: MessageTransfer, U: InnerConfig> _Config<T, Trans
             callbacks,
             timeout: Duration::from_secs(TIMEOUT_TIME),
             connection_initialization_timeout: initialization_timeout,
+            read_buffer_size: None,
             extra,
         }
     }
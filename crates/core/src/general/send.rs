@@ -74,6 +74,16 @@ impl SenderMessage {
             .map_err(|e| BinaryOptionsToolsError::ChannelRequestSendingError(e.to_string()))
     }
 
+    /// Queues the message without waiting, fails if the sending channel is full
+    pub fn try_raw_send<Transfer: MessageTransfer>(
+        &self,
+        msg: Transfer::Raw,
+    ) -> BinaryOptionsResult<()> {
+        self.sender
+            .try_send(msg.message())
+            .map_err(|e| BinaryOptionsToolsError::ChannelRequestSendingError(e.to_string()))
+    }
+
     pub async fn send<Transfer: MessageTransfer>(&self, msg: Transfer) -> BinaryOptionsResult<()> {
         self.sender
             .send(msg.into())
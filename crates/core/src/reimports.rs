@@ -1,4 +1,7 @@
 pub use tokio_tungstenite::{
     Connector, MaybeTlsStream, WebSocketStream, connect_async_tls_with_config,
-    tungstenite::{Bytes, Message, handshake::client::generate_key, http::Request},
+    tungstenite::{
+        Bytes, Message, handshake::client::generate_key, http::Request,
+        protocol::WebSocketConfig,
+    },
 };
@@ -63,15 +63,17 @@ pub fn start_tracing_leveled(terminal: bool, level: LevelFilter) -> anyhow::Resu
 }
 
 #[derive(Clone)]
-pub struct StreamWriter {
-    sender: Sender<String>,
+pub struct StreamWriter<T = String> {
+    sender: Sender<T>,
+    // Turns every parsed log into the item sent on the channel
+    convert: fn(Value) -> T,
 }
 
-impl Write for StreamWriter {
+impl<T> Write for StreamWriter<T> {
     fn write(&mut self, buf: &[u8]) -> std::io::Result<usize> {
         if let Ok(item) = serde_json::from_slice::<Value>(buf) {
             self.sender
-                .send_blocking(item.to_string())
+                .send_blocking((self.convert)(item))
                 .map_err(std::io::Error::other)?;
         }
         Ok(buf.len())
@@ -82,8 +84,8 @@ impl Write for StreamWriter {
     }
 }
 
-impl<'a> MakeWriter<'a> for StreamWriter {
-    type Writer = StreamWriter;
+impl<'a, T: Clone> MakeWriter<'a> for StreamWriter<T> {
+    type Writer = StreamWriter<T>;
     fn make_writer(&'a self) -> Self::Writer {
         self.clone()
     }
@@ -95,10 +97,33 @@ pub fn stream_logs_layer(
 ) -> (
     Box<dyn Layer<Registry> + Send + Sync>,
     RecieverStream<String>,
+) {
+    stream_logs_layer_with(level, timout, |log| log.to_string())
+}
+
+/// Same as `stream_logs_layer` but the logs are sent as the parsed JSON objects,
+/// for consumers that would otherwise parse the strings again
+pub fn stream_logs_layer_values(
+    level: LevelFilter,
+    timout: Option<Duration>,
+) -> (
+    Box<dyn Layer<Registry> + Send + Sync>,
+    RecieverStream<Value>,
+) {
+    stream_logs_layer_with(level, timout, |log| log)
+}
+
+fn stream_logs_layer_with<T: Clone + Send + 'static>(
+    level: LevelFilter,
+    timout: Option<Duration>,
+    convert: fn(Value) -> T,
+) -> (
+    Box<dyn Layer<Registry> + Send + Sync>,
+    RecieverStream<T>,
 ) {
     let (sender, receiver) = bounded(MAX_LOGGING_CHANNEL_CAPACITY);
     let receiver = RecieverStream::new_timed(receiver, timout);
-    let writer = StreamWriter { sender };
+    let writer = StreamWriter { sender, convert };
     let layer = tracing_subscriber::fmt::layer::<Registry>()
         .json()
         .flatten_event(true)